@@ -0,0 +1,323 @@
+"""
+Benchmark suite for the project's classes.
+Replaces the single 100-book timing in oop/main.py with scalable benchmarks
+for both library implementations, the bank account, the calculators and the
+shapes.
+
+Each benchmark runs at every requested size with warmup rounds, repeated
+timed trials (perf_counter, garbage collection paused) and one extra trial
+under tracemalloc for peak memory. Results are written as JSON and two
+result files can be compared.
+
+Usage:
+    python benchmark_suite.py run --sizes 1e3 1e4 1e5 --output results.json
+    python benchmark_suite.py run --filter bank --compare results.json
+    python benchmark_suite.py compare old.json new.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for directory in ("oop", "programming_paradigm", "fns_and_dsa"):
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.append(path)
+
+import library_system  # noqa: E402
+import library_management  # noqa: E402
+from arithmetic_operations import perform_operation  # noqa: E402
+from bank_account import BankAccount  # noqa: E402
+from class_static_methods_demo import Calculator  # noqa: E402
+from polymorphism_demo import Circle, Rectangle  # noqa: E402
+from simple_calculator import SimpleCalculator  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+# Title lookups in library_management are linear scans, so only this many
+# are timed per size
+LOOKUPS = 100
+
+Benchmark = namedtuple("Benchmark", ["name", "setup", "run"])
+Benchmark.__doc__ = """
+setup(size) builds untimed state and returns (state, ops);
+run(state) performs the timed work, ``ops`` operations in total.
+"""
+
+
+def _oop_books(size):
+    books = []
+    for i in range(size):
+        if i % 3 == 0:
+            books.append(library_system.Book(f"Book {i}", f"Author {i % 10}"))
+        elif i % 3 == 1:
+            books.append(library_system.EBook(f"EBook {i}", f"Author {i % 10}", 100 + i))
+        else:
+            books.append(library_system.PrintBook(f"PrintBook {i}", f"Author {i % 10}", 200 + i))
+    return books
+
+
+def _setup_oop_add(size):
+    return (library_system.Library(), _oop_books(size)), size
+
+
+def _run_add_books(state):
+    library, books = state
+    add_book = library.add_book
+    for book in books:
+        add_book(book)
+
+
+def _setup_management_add(size):
+    books = [library_management.Book(f"Book {i}", f"Author {i % 10}") for i in range(size)]
+    return (library_management.Library(), books), size
+
+
+def _setup_management_lookup(size):
+    library = library_management.Library()
+    for i in range(size):
+        library.add_book(library_management.Book(f"Book {i}", f"Author {i % 10}"))
+    step = max(1, size // LOOKUPS)
+    titles = [f"Book {i}" for i in range(0, size, step)][:LOOKUPS]
+    return (library, titles), 2 * len(titles)
+
+
+def _run_management_lookup(state):
+    library, titles = state
+    for title in titles:
+        library.check_out_book(title)
+        library.return_book(title)
+
+
+def _setup_bank(size):
+    pairs = size // 2
+    return (BankAccount(0.0), pairs), 2 * pairs
+
+
+def _run_bank(state):
+    account, pairs = state
+    deposit, withdraw = account.deposit, account.withdraw
+    for _ in range(pairs):
+        deposit(10.0)
+        withdraw(5.0)
+
+
+def _setup_simple_calculator(size):
+    return (SimpleCalculator(), [(i + 1, (i % 7) + 1) for i in range(size)]), size
+
+
+def _run_simple_calculator(state):
+    calc, operands = state
+    operations = (calc.add, calc.subtract, calc.multiply, calc.divide)
+    for i, (a, b) in enumerate(operands):
+        operations[i & 3](a, b)
+
+
+def _setup_operands(size):
+    return [(i + 1, (i % 7) + 1) for i in range(size)], size
+
+
+def _run_static_calculator(operands):
+    add = Calculator.add
+    for a, b in operands:
+        add(a, b)
+
+
+def _run_perform_operation(operands):
+    names = ("add", "subtract", "multiply", "divide")
+    for i, (a, b) in enumerate(operands):
+        perform_operation(a, b, names[i & 3])
+
+
+def _setup_shapes(size):
+    shapes = [Rectangle(i % 100 + 1, i % 50 + 1) if i % 2 else Circle(i % 30 + 1) for i in range(size)]
+    return shapes, size
+
+
+def _run_shapes(shapes):
+    total = 0.0
+    for shape in shapes:
+        total += shape.area()
+    return total
+
+
+BENCHMARKS = [
+    Benchmark("library_system.add_book", _setup_oop_add, _run_add_books),
+    Benchmark("library_management.add_book", _setup_management_add, _run_add_books),
+    Benchmark("library_management.lookup", _setup_management_lookup, _run_management_lookup),
+    Benchmark("bank_account.deposit_withdraw", _setup_bank, _run_bank),
+    Benchmark("simple_calculator.mixed", _setup_simple_calculator, _run_simple_calculator),
+    Benchmark("class_static_methods_demo.add", _setup_operands, _run_static_calculator),
+    Benchmark("arithmetic_operations.perform_operation", _setup_operands, _run_perform_operation),
+    Benchmark("polymorphism_demo.area", _setup_shapes, _run_shapes),
+]
+
+
+def _timed_trial(benchmark, size):
+    state, ops = benchmark.setup(size)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        benchmark.run(state)
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed, ops
+
+
+def _peak_memory(benchmark, size):
+    """Peak bytes allocated by one setup + run under tracemalloc."""
+    tracemalloc.start()
+    try:
+        state, _ = benchmark.setup(size)
+        benchmark.run(state)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(benchmark, size, repeat=5, warmup=1, memory=True):
+    """Run one benchmark at one size and return its result record."""
+    for _ in range(warmup):
+        _timed_trial(benchmark, size)
+    times = []
+    ops = 0
+    for _ in range(repeat):
+        elapsed, ops = _timed_trial(benchmark, size)
+        times.append(elapsed)
+    median = statistics.median(times)
+    return {
+        "benchmark": benchmark.name,
+        "size": size,
+        "ops": ops,
+        "times_s": times,
+        "min_s": min(times),
+        "median_s": median,
+        "mean_s": statistics.fmean(times),
+        "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "ns_per_op": median / ops * 1e9 if ops else None,
+        "peak_bytes": _peak_memory(benchmark, size) if memory else None,
+    }
+
+
+def run_suite(sizes, repeat=5, warmup=1, name_filter=None, memory=True, progress=None):
+    """Run every matching benchmark at every size and return the results document."""
+    results = []
+    for size in sizes:
+        for benchmark in BENCHMARKS:
+            if name_filter and name_filter not in benchmark.name:
+                continue
+            result = run_benchmark(benchmark, size, repeat, warmup, memory)
+            results.append(result)
+            if progress:
+                progress(result)
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Compare two results documents by median time.
+
+    Returns:
+        list: (benchmark, size, baseline_s, current_s, ratio, status) rows,
+        where status is "faster", "slower" or "same" relative to ``threshold``
+    """
+    previous = {(r["benchmark"], r["size"]): r for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        old = previous.get((result["benchmark"], result["size"]))
+        if old is None:
+            continue
+        ratio = result["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        if ratio > 1 + threshold:
+            status = "slower"
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = "same"
+        rows.append((result["benchmark"], result["size"], old["median_s"], result["median_s"],
+                     ratio, status))
+    return rows
+
+
+def print_result(result):
+    peak = f"{result['peak_bytes'] / 1024:10,.0f} KiB" if result["peak_bytes"] is not None else ""
+    # Sizes too small for a benchmark's unit of work (e.g. one deposit/withdraw pair) do no operations
+    per_op = f"{result['ns_per_op']:10,.0f}" if result["ns_per_op"] is not None else f"{'n/a':>10}"
+    print(f"{result['benchmark']:<42} {result['size']:>10,} {result['median_s']:10.4f} s "
+          f"{per_op} ns/op {peak}")
+
+
+def print_comparison(rows):
+    print(f"{'benchmark':<42} {'size':>10} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, size, old, new, ratio, status in rows:
+        print(f"{name:<42} {size:>10,} {old:10.4f} {new:10.4f} {ratio:7.2f}  {status}")
+
+
+def _load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _size(text):
+    return int(float(text))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Project benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--sizes", nargs="+", type=_size, default=DEFAULT_SIZES,
+                            help="Problem sizes, e.g. 1e3 1e5 1e7 (default: 1e3 1e4 1e5)")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed trials per size")
+    run_parser.add_argument("--warmup", type=int, default=1, help="Untimed trials per size")
+    run_parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    run_parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc runs")
+    run_parser.add_argument("--output", help="Write results as JSON to this file")
+    run_parser.add_argument("--compare", help="Compare against a previous results file")
+    run_parser.add_argument("--threshold", type=float, default=0.10,
+                            help="Relative change reported as faster/slower (default: 0.10)")
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        print_comparison(compare(_load(args.baseline), _load(args.current), args.threshold))
+        return
+
+    document = run_suite(args.sizes, args.repeat, args.warmup, args.filter,
+                         not args.no_memory, progress=print_result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+    if args.compare:
+        print()
+        print_comparison(compare(_load(args.compare), document, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
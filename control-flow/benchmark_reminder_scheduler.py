@@ -0,0 +1,61 @@
+"""
+Benchmark ReminderScheduler on a large synthetic task set.
+
+Usage: python benchmark_reminder_scheduler.py [tasks]
+The full run is ``python benchmark_reminder_scheduler.py 10000000``.
+"""
+
+import random
+import sys
+import time
+
+from reminder_scheduler import ReminderScheduler, reminder_message
+
+PRIORITIES = ["high", "medium", "low"]
+
+
+def synthetic_tasks(count, seed=0):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (f"task-{i}", rng.choice(PRIORITIES), rng.random() < 0.3, rng.randrange(86400))
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {elapsed:8.3f} s  {count / elapsed:>14,.0f} ops/s")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tasks = list(synthetic_tasks(count))
+    print(f"Tasks: {count:,}")
+
+    scheduler = ReminderScheduler()
+    timed("bulk load", lambda: scheduler.load(tasks), count)
+
+    changes = max(1, count // 10)
+    rng = random.Random(1)
+
+    def reprioritize():
+        for _ in range(changes):
+            scheduler.reprioritize(f"task-{rng.randrange(count)}", rng.choice(PRIORITIES))
+
+    timed("reprioritize (10%)", reprioritize, changes)
+    timed("render top 1000", lambda: scheduler.render(1000), 1000)
+    timed("pop + render all", lambda: sum(1 for _ in scheduler.drain()), count)
+
+    incremental = ReminderScheduler()
+
+    def insert():
+        for task in tasks:
+            incremental.add(*task)
+
+    timed("incremental insert", insert, count)
+    timed("pop all", lambda: [reminder_message(incremental.pop()) for _ in range(len(incremental))], count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark multiplication-table generation strategies.
+
+Usage: python benchmark_table_generator.py [rows] [columns]
+The full comparison is ``python benchmark_table_generator.py 10000 10000``.
+Output is written to os.devnull so the timings measure generation and
+formatting rather than the disk.
+"""
+
+import os
+import sys
+import time
+
+from table_generator import np, table_matrix, table_rows, write_binary, write_csv
+
+
+def fstring_rows(rows, columns, out):
+    """The original approach: one f-string and one write per entry."""
+    for number in range(1, rows + 1):
+        for i in range(1, columns + 1):
+            out.write(f"{number} * {i} = {number * i}\n")
+
+
+def vectorized_csv(rows, columns, out):
+    write_csv(table_matrix(range(1, rows + 1), range(1, columns + 1)), out)
+
+
+def streamed_csv(rows, columns, out):
+    write_csv(table_rows(range(1, rows + 1), range(1, columns + 1)), out)
+
+
+def vectorized_binary(rows, columns, out):
+    write_binary(table_matrix(range(1, rows + 1), range(1, columns + 1)), out.buffer)
+
+
+def streamed_binary(rows, columns, out):
+    write_binary(table_rows(range(1, rows + 1), range(1, columns + 1)), out.buffer)
+
+
+STRATEGIES = [
+    ("row-by-row f-string", fstring_rows),
+    ("vectorized CSV", vectorized_csv),
+    ("streamed CSV", streamed_csv),
+    ("vectorized binary", vectorized_binary),
+    ("streamed binary", streamed_binary),
+]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else rows
+    print(f"Table: {rows:,} x {columns:,} (NumPy {'available' if np is not None else 'not installed'})")
+    baseline = None
+    for name, strategy in STRATEGIES:
+        with open(os.devnull, "w", encoding="utf-8") as out:
+            start = time.perf_counter()
+            strategy(rows, columns, out)
+            out.flush()
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{name:<22} {elapsed:8.3f} s  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
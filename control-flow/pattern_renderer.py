@@ -0,0 +1,130 @@
+"""
+Buffered pattern renderer.
+Builds each row of a pattern once and writes it through a single buffered
+writer, or straight into a memory-mapped output file, so large patterns use
+memory proportional to one row rather than the whole pattern.
+"""
+
+import argparse
+import io
+import mmap
+import sys
+
+SHAPES = ["square", "hollow", "triangle", "diamond"]
+NEWLINE = b"\n"
+BUFFER_SIZE = 1 << 20
+
+
+def rows(shape, size, char=b"*"):
+    """
+    Yield the rows of a pattern as bytes-like objects without newlines.
+
+    Rows are slices (memoryviews) of one preallocated line, so no row is
+    rebuilt character by character.
+
+    Args:
+        shape (str): One of square, hollow, triangle or diamond
+        size (int): Side length (square, hollow, triangle) or half-height (diamond)
+        char (bytes): The single character to draw with
+
+    Raises:
+        ValueError: If the shape is unknown or size is negative
+    """
+    if size < 0:
+        raise ValueError("Size must not be negative.")
+    if shape == "square":
+        row = char * size
+        for _ in range(size):
+            yield row
+    elif shape == "hollow":
+        full = char * size
+        middle = char + b" " * (size - 2) + char if size > 1 else full
+        for row in range(size):
+            yield full if row in (0, size - 1) else middle
+    elif shape == "triangle":
+        line = memoryview(char * size)
+        for row in range(1, size + 1):
+            yield line[:row]
+    elif shape == "diamond":
+        # Row i is line[i:size + 2 * i]: (size - 1 - i) spaces then 2i + 1 characters
+        line = memoryview(b" " * (size - 1) + char * (2 * size - 1)) if size else memoryview(b"")
+        for row in range(size):
+            yield line[row:size + 2 * row]
+        for row in range(size - 2, -1, -1):
+            yield line[row:size + 2 * row]
+    else:
+        raise ValueError(f"Unknown shape: {shape}. Choose from {', '.join(SHAPES)}.")
+
+
+def render(shape, size, out, char=b"*"):
+    """
+    Write a pattern to a binary stream.
+
+    Args:
+        out: A binary file object; wrapped in a BufferedWriter if it is unbuffered
+
+    Returns:
+        int: Number of bytes written
+    """
+    wrapper = None
+    if not isinstance(out, io.BufferedIOBase):
+        out = wrapper = io.BufferedWriter(out, BUFFER_SIZE)
+    write = out.write
+    written = 0
+    try:
+        for row in rows(shape, size, char):
+            write(row)
+            write(NEWLINE)
+            written += len(row) + 1
+        out.flush()
+    finally:
+        if wrapper is not None:
+            # Detach so collecting the wrapper does not close the caller's stream
+            wrapper.detach()
+    return written
+
+
+def render_to_file(shape, size, path, char=b"*"):
+    """
+    Write a pattern into a preallocated, memory-mapped file.
+
+    The file is sized up front from the row lengths, then each row is copied
+    into place, so the operating system pages the output out as it goes.
+
+    Returns:
+        int: Size of the file in bytes
+    """
+    total = sum(len(row) + 1 for row in rows(shape, size, char))
+    with open(path, "w+b") as f:
+        f.truncate(total)
+        if total == 0:
+            return 0
+        with mmap.mmap(f.fileno(), total) as mm:
+            position = 0
+            for row in rows(shape, size, char):
+                end = position + len(row)
+                mm[position:end] = row
+                mm[end:end + 1] = NEWLINE
+                position = end + 1
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render large text patterns")
+    parser.add_argument("shape", choices=SHAPES)
+    parser.add_argument("size", type=int)
+    parser.add_argument("--output", help="Write to a memory-mapped file instead of stdout")
+    parser.add_argument("--char", default="*", help="Character to draw with (default: *)")
+    args = parser.parse_args()
+
+    char = args.char.encode()
+    if len(char) != 1:
+        parser.error("--char must be a single ASCII character")
+    if args.output:
+        render_to_file(args.shape, args.size, args.output, char)
+    else:
+        render(args.shape, args.size, sys.stdout.buffer, char)
+
+
+if __name__ == "__main__":
+    main()
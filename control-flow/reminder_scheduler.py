@@ -0,0 +1,154 @@
+"""
+Priority-queue reminder scheduler.
+Applies the daily_reminder rules to many tasks at once, ordering them with a
+heap keyed on priority, time-bound flag and deadline.
+"""
+
+import heapq
+import itertools
+from collections import namedtuple
+
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+Reminder = namedtuple("Reminder", ["task", "priority", "time_bound", "deadline"])
+
+
+def reminder_message(reminder):
+    """Return the message daily_reminder.py prints for a task."""
+    task, priority, time_bound = reminder.task, reminder.priority, reminder.time_bound
+    if time_bound:
+        return f"Reminder: '{task}' is a {priority} priority task that requires immediate attention today!"
+    if priority == "low":
+        return f"Note: '{task}' is a low priority task. Consider completing it when you have free time."
+    return f"Reminder: '{task}' is a {priority} priority task"
+
+
+class ReminderScheduler:
+    """
+    Orders reminders by (priority, time-bound first, earliest deadline).
+
+    Tasks are identified by name. Insert, pop and reprioritize are O(log n):
+    changing a task pushes a fresh heap entry and marks the old one as
+    removed, and removed entries are skipped when they reach the top.
+    """
+
+    def __init__(self, tasks=()):
+        """
+        Initialize a scheduler, optionally loading tasks in bulk.
+
+        Args:
+            tasks (iterable): (task, priority, time_bound, deadline) tuples;
+                time_bound and deadline may be omitted
+        """
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self.load(tasks)
+
+    def _entry(self, task, priority, time_bound=False, deadline=None):
+        priority = priority.lower()
+        if priority not in PRIORITY_RANK:
+            raise ValueError(f"Invalid priority: {priority}. Use high, medium or low.")
+        reminder = Reminder(task, priority, bool(time_bound), deadline)
+        # Tasks without a deadline sort after those with one
+        entry = [PRIORITY_RANK[priority], not time_bound, deadline is None,
+                 0 if deadline is None else deadline, next(self._counter), reminder]
+        old = self._entries.get(task)
+        if old is not None:
+            old[-1] = None
+        self._entries[task] = entry
+        return entry
+
+    def add(self, task, priority, time_bound=False, deadline=None):
+        """Schedule a task, replacing any existing task with the same name."""
+        heapq.heappush(self._heap, self._entry(task, priority, time_bound, deadline))
+        # Rebuild once removed entries outnumber live ones to keep the heap bounded
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def load(self, tasks):
+        """
+        Schedule many tasks at once.
+
+        New entries are appended and the heap is rebuilt with a single O(n)
+        heapify instead of one push per task.
+
+        Returns:
+            int: Number of tasks loaded
+        """
+        before = len(self._heap)
+        self._heap.extend(self._entry(*task) for task in tasks)
+        loaded = len(self._heap) - before
+        if loaded:
+            heapq.heapify(self._heap)
+        return loaded
+
+    def reprioritize(self, task, priority=None, time_bound=None, deadline=None):
+        """
+        Change the priority, time-bound flag or deadline of a scheduled task.
+
+        Raises:
+            KeyError: If the task is not scheduled
+        """
+        current = self._entries[task][-1]
+        self.add(
+            task,
+            current.priority if priority is None else priority,
+            current.time_bound if time_bound is None else time_bound,
+            current.deadline if deadline is None else deadline,
+        )
+
+    def remove(self, task):
+        """Unschedule a task. Returns True if it was scheduled."""
+        entry = self._entries.pop(task, None)
+        if entry is None:
+            return False
+        entry[-1] = None
+        return True
+
+    def _discard_removed(self):
+        heap = self._heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+
+    def peek(self):
+        """Return the next reminder without removing it, or None if empty."""
+        self._discard_removed()
+        return self._heap[0][-1] if self._heap else None
+
+    def pop(self):
+        """
+        Remove and return the most urgent reminder.
+
+        Raises:
+            IndexError: If no tasks are scheduled
+        """
+        self._discard_removed()
+        if not self._heap:
+            raise IndexError("pop from an empty scheduler")
+        reminder = heapq.heappop(self._heap)[-1]
+        del self._entries[reminder.task]
+        return reminder
+
+    def drain(self):
+        """Pop every reminder in order, yielding its message."""
+        while self._entries:
+            yield reminder_message(self.pop())
+
+    def render(self, limit=None):
+        """
+        Return messages for the most urgent reminders without unscheduling them.
+
+        Args:
+            limit (int): Only render this many reminders (all by default)
+        """
+        live = self._entries.values()
+        entries = sorted(live) if limit is None else heapq.nsmallest(limit, live)
+        return [reminder_message(entry[-1]) for entry in entries]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, task):
+        return task in self._entries
@@ -0,0 +1,165 @@
+"""
+Table-driven dispatch for the weather_advice and match_case_calculator rules.
+Each if/elif or match chain is compiled into a dict lookup so large files of
+conditions or operations can be processed in batch, with per-branch hit
+counts for profiling.
+"""
+
+import argparse
+import operator
+import sys
+import time
+
+DEFAULT_BRANCH = "<default>"
+# Calculator lines rejected before the rule lookup
+MALFORMED_BRANCH = "<malformed>"
+INVALID_NUMBER_BRANCH = "<invalid number>"
+
+
+def normalize_key(value):
+    """Strip surrounding whitespace and lower-case a raw input value."""
+    return value.strip().lower()
+
+
+class RuleTable:
+    """A compiled mapping from normalized input to an action, with hit counts."""
+
+    def __init__(self, rules, default, normalize=normalize_key):
+        """
+        Args:
+            rules (dict): Raw input value -> action
+            default: Action returned when no rule matches
+            normalize (callable): Applied once to every key and every input
+        """
+        self.normalize = normalize
+        self.rules = {normalize(key): action for key, action in rules.items()}
+        self.default = default
+        self.hits = dict.fromkeys(self.rules, 0)
+        self.hits[DEFAULT_BRANCH] = 0
+
+    def lookup(self, value):
+        """Return the action for an input value and count the branch taken."""
+        key = self.normalize(value)
+        action = self.rules.get(key)
+        if action is None:
+            self.hits[DEFAULT_BRANCH] += 1
+            return self.default
+        self.hits[key] += 1
+        return action
+
+    def record(self, branch):
+        """Count an outcome decided outside the table, such as unparsable input."""
+        self.hits[branch] = self.hits.get(branch, 0) + 1
+
+    def reset(self):
+        """Zero every hit counter."""
+        for key in self.hits:
+            self.hits[key] = 0
+
+
+def weather_table():
+    """Return a RuleTable with the weather_advice.py recommendations."""
+    return RuleTable(
+        {
+            "sunny": "Wear a t-shirt and sunglasses.",
+            "rainy": "Don't forget your umbrella and a raincoat.",
+            "cold": "Make sure to wear a warm coat and a scarf.",
+        },
+        "Sorry, I don't have recommendations for this weather.",
+    )
+
+
+def _result(func):
+    return lambda num1, num2: f"The result is {func(num1, num2)}"
+
+
+def _divide(num1, num2):
+    if num2 == 0:
+        return "Cannot divide by zero."
+    return f"The result is {num1 / num2}"
+
+
+def calculator_table():
+    """Return a RuleTable with the match_case_calculator.py operations."""
+    return RuleTable(
+        {
+            "+": _result(operator.add),
+            "-": _result(operator.sub),
+            "*": _result(operator.mul),
+            "/": _divide,
+        },
+        lambda num1, num2: "Invalid operation.",
+        normalize=str.strip,
+    )
+
+
+def advise_all(lines, table=None):
+    """Yield weather advice for each line of a conditions file."""
+    lookup = (table or weather_table()).lookup
+    for line in lines:
+        yield lookup(line)
+
+
+def calculate_all(lines, table=None):
+    """
+    Yield the calculator message for each ``num1 op num2`` line.
+
+    Lines whose numbers cannot be parsed yield "Invalid number." Both kinds
+    of rejected line are counted in the table's hits, so hit totals match the
+    number of lines.
+    """
+    table = table or calculator_table()
+    lookup, record = table.lookup, table.record
+    for line in lines:
+        parts = line.split()
+        if len(parts) != 3:
+            record(MALFORMED_BRANCH)
+            yield "Invalid operation."
+            continue
+        try:
+            num1, num2 = float(parts[0]), float(parts[2])
+        except ValueError:
+            record(INVALID_NUMBER_BRANCH)
+            yield "Invalid number."
+            continue
+        yield lookup(parts[1])(num1, num2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch weather advice and calculator rules")
+    parser.add_argument("mode", choices=["weather", "calculator"])
+    parser.add_argument("file", nargs="?", help="Input file, one condition or operation per line "
+                                                "(defaults to stdin)")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print throughput and per-branch hit counts to stderr")
+    parser.add_argument("--quiet", action="store_true", help="Do not print each result")
+    args = parser.parse_args()
+
+    if args.mode == "weather":
+        table, process = weather_table(), advise_all
+    else:
+        table, process = calculator_table(), calculate_all
+
+    source = open(args.file, encoding="utf-8") if args.file else sys.stdin
+    count = 0
+    start = time.perf_counter()
+    try:
+        write = sys.stdout.write
+        for message in process(source, table):
+            count += 1
+            if not args.quiet:
+                write(message + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    elapsed = time.perf_counter() - start
+
+    if args.stats:
+        rate = count / elapsed if elapsed else 0
+        print(f"Processed {count:,} lines in {elapsed:.3f} s ({rate:,.0f} lines/s)", file=sys.stderr)
+        for branch, hits in sorted(table.hits.items(), key=lambda item: -item[1]):
+            print(f"  {branch:<16} {hits:>12,}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
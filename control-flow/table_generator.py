@@ -0,0 +1,117 @@
+"""
+Multiplication table generator.
+Builds full N x M tables either at once as a NumPy outer product or lazily
+as a stream of rows, and writes them as CSV or raw binary in bulk.
+"""
+
+import argparse
+import sys
+from array import array
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; rows fall back to lists
+    np = None
+
+# Rows joined into one write when producing CSV
+CSV_ROWS_PER_WRITE = 256
+
+
+def table_matrix(multipliers, multiplicands):
+    """
+    Return the full table as a 2-D array (row i holds multipliers[i] * each multiplicand).
+
+    Uses ``numpy.multiply.outer`` when NumPy is installed, otherwise a list of lists.
+    The dtype follows the inputs, so float factors give float products as
+    ``table_rows`` does.
+    """
+    if np is not None:
+        return np.multiply.outer(np.asarray(multipliers), np.asarray(multiplicands))
+    return list(table_rows(multipliers, multiplicands))
+
+
+def table_rows(multipliers, multiplicands):
+    """Lazily yield one row of the table at a time as a list of ints."""
+    multiplicands = list(multiplicands)
+    for number in multipliers:
+        yield [number * value for value in multiplicands]
+
+
+def write_csv(rows, out, rows_per_write=CSV_ROWS_PER_WRITE):
+    """
+    Write table rows as comma separated text.
+
+    Rows are formatted in groups and each group goes out in a single write.
+
+    Returns:
+        int: Number of rows written
+    """
+    rows = iter(rows)
+    count = 0
+    while True:
+        group = list(islice(rows, rows_per_write))
+        if not group:
+            return count
+        if np is not None and isinstance(group[0], np.ndarray):
+            group = [row.tolist() for row in group]
+        out.write("".join(",".join(map(str, row)) + "\n" for row in group))
+        count += len(group)
+
+
+def write_binary(table, out):
+    """
+    Write a table as native-endian 64-bit integers, row after row.
+
+    Accepts a NumPy matrix (written with a single ``tofile``) or any iterable
+    of rows (each written with ``array.tofile``).
+
+    Returns:
+        int: Number of values written
+    """
+    if np is not None and isinstance(table, np.ndarray):
+        table.astype(np.int64, copy=False).tofile(out)
+        return table.size
+    count = 0
+    for row in table:
+        values = array("q", row)
+        values.tofile(out)
+        count += len(values)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate multiplication tables")
+    parser.add_argument("rows", type=int, help="Multipliers 1..rows")
+    parser.add_argument("columns", type=int, help="Multiplicands 1..columns")
+    parser.add_argument("--format", choices=["csv", "binary"], default="csv")
+    parser.add_argument("--output", help="Output file (defaults to stdout)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Generate rows lazily instead of building the whole matrix")
+    args = parser.parse_args()
+
+    multipliers = range(1, args.rows + 1)
+    multiplicands = range(1, args.columns + 1)
+    if args.stream:
+        table = table_rows(multipliers, multiplicands)
+    else:
+        table = table_matrix(multipliers, multiplicands)
+
+    if args.format == "csv":
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            write_csv(table, out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+    else:
+        out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            write_binary(table, out)
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import io
+import os
+import tempfile
+import unittest
+from pattern_renderer import render, render_to_file, rows
+
+
+def lines(shape, size):
+    return [bytes(row).decode() for row in rows(shape, size)]
+
+
+class TestRows(unittest.TestCase):
+    """Test class for the row generator."""
+
+    def test_shapes(self):
+        """Each shape produces the expected rows."""
+        self.assertEqual(lines("square", 3), ["***"] * 3)
+        self.assertEqual(lines("hollow", 4), ["****", "*  *", "*  *", "****"])
+        self.assertEqual(lines("triangle", 3), ["*", "**", "***"])
+        self.assertEqual(lines("diamond", 3), ["  *", " ***", "*****", " ***", "  *"])
+
+    def test_small_sizes(self):
+        """Sizes 0 and 1 give no rows and a single character."""
+        for shape in ["square", "hollow", "triangle", "diamond"]:
+            self.assertEqual(lines(shape, 0), [])
+            self.assertEqual(lines(shape, 1), ["*"])
+
+    def test_invalid(self):
+        """Unknown shapes and negative sizes raise ValueError."""
+        with self.assertRaises(ValueError):
+            list(rows("circle", 3))
+        with self.assertRaises(ValueError):
+            list(rows("square", -1))
+
+
+class TestRender(unittest.TestCase):
+    """Test class for the stream and memory-mapped writers."""
+
+    def test_render_to_buffer(self):
+        """render writes every row with a newline and returns the byte count."""
+        out = io.BytesIO()
+        self.assertEqual(render("triangle", 3, out, b"#"), 9)
+        self.assertEqual(out.getvalue(), b"#\n##\n###\n")
+
+    def test_render_leaves_unbuffered_file_open(self):
+        """Wrapping an unbuffered file does not close it."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "square.txt")
+            with open(path, "wb", buffering=0) as f:
+                render("square", 3, f)
+                self.assertFalse(f.closed)
+                f.write(b"end")
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"***\n***\n***\nend")
+
+    def test_render_to_file_matches_render(self):
+        """The memory-mapped output matches the streamed output."""
+        with tempfile.TemporaryDirectory() as directory:
+            for shape, size in [("diamond", 5), ("hollow", 1), ("square", 0)]:
+                path = os.path.join(directory, f"{shape}.txt")
+                expected = io.BytesIO()
+                render(shape, size, expected)
+                self.assertEqual(render_to_file(shape, size, path), len(expected.getvalue()))
+                with open(path, "rb") as f:
+                    self.assertEqual(f.read(), expected.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from reminder_scheduler import ReminderScheduler
+
+
+class TestReminderScheduler(unittest.TestCase):
+    """Test class for ReminderScheduler ordering and messages."""
+
+    def setUp(self):
+        """Set up a scheduler loaded with a mix of tasks."""
+        self.scheduler = ReminderScheduler([
+            ("laundry", "low", False),
+            ("report", "high", False, 17),
+            ("taxes", "high", True, 20),
+            ("call", "high", True, 9),
+            ("email", "medium"),
+        ])
+
+    def test_pop_order(self):
+        """Tasks pop by priority, then time-bound first, then earliest deadline."""
+        order = [self.scheduler.pop().task for _ in range(len(self.scheduler))]
+        self.assertEqual(order, ["call", "taxes", "report", "email", "laundry"])
+        with self.assertRaises(IndexError):
+            self.scheduler.pop()
+
+    def test_reprioritize_and_remove(self):
+        """Reprioritized tasks move, removed tasks never pop."""
+        self.scheduler.reprioritize("laundry", "high", time_bound=True, deadline=1)
+        self.assertTrue(self.scheduler.remove("call"))
+        self.assertFalse(self.scheduler.remove("call"))
+        self.assertEqual(self.scheduler.peek().task, "laundry")
+        self.assertEqual(len(self.scheduler), 4)
+        with self.assertRaises(KeyError):
+            self.scheduler.reprioritize("missing", "low")
+        with self.assertRaises(ValueError):
+            self.scheduler.add("nap", "urgent")
+
+    def test_messages_match_daily_reminder(self):
+        """Rendered messages use the daily_reminder wording."""
+        self.assertEqual(self.scheduler.render(1), [
+            "Reminder: 'call' is a high priority task that requires immediate attention today!"
+        ])
+        messages = list(self.scheduler.drain())
+        self.assertEqual(messages[2], "Reminder: 'report' is a high priority task")
+        self.assertEqual(
+            messages[-1],
+            "Note: 'laundry' is a low priority task. Consider completing it when you have free time.",
+        )
+        self.assertEqual(len(self.scheduler), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import unittest
+from rule_dispatch import (DEFAULT_BRANCH, INVALID_NUMBER_BRANCH, MALFORMED_BRANCH, advise_all,
+                           calculate_all, calculator_table, weather_table)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_script(name, answers):
+    """Run an interactive script with the given answers and return its last output."""
+    result = subprocess.run([sys.executable, os.path.join(HERE, name)], input="\n".join(answers) + "\n",
+                            capture_output=True, text=True, check=True)
+    return result.stdout.rsplit(": ", 1)[-1].strip()
+
+
+class TestRuleDispatch(unittest.TestCase):
+    """Test class for the compiled rule tables."""
+
+    def test_weather_matches_script(self):
+        """Every weather branch gives the same advice as weather_advice.py."""
+        for weather in ["sunny", "rainy", "cold", "foggy"]:
+            self.assertEqual(next(advise_all([weather])), run_script("weather_advice.py", [weather]))
+
+    def test_calculator_matches_script(self):
+        """Every operation gives the same message as match_case_calculator.py."""
+        for num1, operation, num2 in [("6", "+", "2"), ("6", "-", "2"), ("6", "*", "2"),
+                                      ("7", "/", "2"), ("1", "/", "0"), ("1", "%", "2")]:
+            self.assertEqual(
+                next(calculate_all([f"{num1} {operation} {num2}"])),
+                run_script("match_case_calculator.py", [num1, num2, operation]),
+            )
+
+    def test_input_is_normalized(self):
+        """Weather conditions ignore case and surrounding whitespace."""
+        table = weather_table()
+        self.assertEqual(list(advise_all([" Sunny\n", "SUNNY"], table)), [table.rules["sunny"]] * 2)
+        self.assertEqual(table.hits["sunny"], 2)
+
+    def test_hits_cover_every_line(self):
+        """Malformed and non-numeric lines are counted alongside table branches."""
+        table = calculator_table()
+        lines = ["1 + 2", "1 ^ 2", "x + 1", "1 +", "3 / 0"]
+        self.assertEqual(len(list(calculate_all(lines, table))), 5)
+        self.assertEqual(sum(table.hits.values()), 5)
+        self.assertEqual(table.hits[MALFORMED_BRANCH], 1)
+        self.assertEqual(table.hits[INVALID_NUMBER_BRANCH], 1)
+        self.assertEqual(table.hits[DEFAULT_BRANCH], 1)
+        table.reset()
+        self.assertEqual(sum(table.hits.values()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
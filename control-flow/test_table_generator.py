@@ -0,0 +1,50 @@
+import io
+import os
+import tempfile
+import unittest
+from array import array
+from table_generator import table_matrix, table_rows, write_binary, write_csv
+
+
+def as_rows(table):
+    return table.tolist() if hasattr(table, "tolist") else table
+
+
+class TestTableGenerator(unittest.TestCase):
+    """Test class for table generation and output."""
+
+    def test_matrix_and_rows_agree(self):
+        """The full matrix and the row stream hold the same products."""
+        expected = [[1, 2, 3], [2, 4, 6]]
+        self.assertEqual(as_rows(table_matrix(range(1, 3), range(1, 4))), expected)
+        self.assertEqual(list(table_rows(range(1, 3), range(1, 4))), expected)
+        for multipliers, multiplicands, expected in [([0.5], [4], [[2.0]]), ([2], [1.5, 3], [[3.0, 6]])]:
+            self.assertEqual(as_rows(table_matrix(multipliers, multiplicands)), expected)
+            self.assertEqual(list(table_rows(multipliers, multiplicands)), expected)
+
+    def test_rows_with_mixed_types(self):
+        """Int multipliers work with float multiplicands and vice versa."""
+        self.assertEqual(list(table_rows([2], [1.5])), [[3.0]])
+        self.assertEqual(list(table_rows([0.5], [4])), [[2.0]])
+
+    def test_write_csv(self):
+        """Rows are written as comma separated lines across write groups."""
+        out = io.StringIO()
+        self.assertEqual(write_csv(table_rows(range(1, 4), range(1, 3)), out, rows_per_write=2), 3)
+        self.assertEqual(out.getvalue(), "1,2\n2,4\n3,6\n")
+
+    def test_write_binary(self):
+        """Binary output is native int64 values in row order."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            for table in (table_matrix(range(1, 3), range(1, 4)), table_rows(range(1, 3), range(1, 4))):
+                with open(path, "wb") as f:
+                    self.assertEqual(write_binary(table, f), 6)
+                values = array("q")
+                with open(path, "rb") as f:
+                    values.fromfile(f, 6)
+                self.assertEqual(values.tolist(), [1, 2, 3, 2, 4, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,11 @@
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
+
+@timed("arithmetic_operations.perform_operation")
 def perform_operation(num1, num2, operation):
     if operation == "add":
         return num1 + num2
@@ -0,0 +1,45 @@
+"""
+Benchmark batch date arithmetic against the per-call datetime path.
+
+Usage: python benchmark_explore_datetime.py [records]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from explore_datetime import add_days, format_dates, np
+
+
+def per_call(start, offsets):
+    """The original approach: one timedelta and one strftime per record."""
+    return [(start + timedelta(days=days)).strftime('%Y-%m-%d') for days in offsets]
+
+
+def batch(start, offsets):
+    return format_dates(add_days(start.date(), offsets))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    offsets = [rng.randrange(0, 3650) for _ in range(records)]
+    start = datetime(2025, 1, 1)
+
+    print(f"Records: {records:,} (NumPy {'available' if np is not None else 'not installed'})")
+    baseline, expected = timed(per_call, start, offsets)
+    print(f"datetime + strftime: {baseline:.3f} s")
+    elapsed, result = timed(batch, start, offsets)
+    print(f"add_days + format_dates: {elapsed:.3f} s ({baseline / elapsed:.1f}x)")
+    assert result == expected, "batch results differ from the per-call path"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Throughput benchmark for the streaming sensor-feed converter.
+
+Usage: python benchmark_sensor_feed.py [count] [window] [interval]
+The full run is ``python benchmark_sensor_feed.py 100000000``; the default
+count is kept small enough for a quick local check.
+"""
+
+import sys
+import time
+
+from sensor_feed import SensorFeed, synthetic_feed
+
+
+def run(count, window=3600, interval=3600):
+    """Process ``count`` synthetic readings and return (seconds, aggregates)."""
+    feed = SensorFeed("F", "C", window=window, interval=interval)
+    emitted = 0
+    start = time.perf_counter()
+    for _ in feed.process(synthetic_feed(count)):
+        emitted += 1
+    return time.perf_counter() - start, emitted
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    window = int(sys.argv[2]) if len(sys.argv) > 2 else 3600
+    interval = int(sys.argv[3]) if len(sys.argv) > 3 else 3600
+
+    elapsed, emitted = run(count, window, interval)
+    print(f"Readings: {count:,} (window={window}, interval={interval})")
+    print(f"Aggregates emitted: {emitted:,}")
+    print(f"Elapsed: {elapsed:.2f} s")
+    print(f"Throughput: {count / elapsed:,.0f} readings/s")
+
+
+if __name__ == "__main__":
+    main()
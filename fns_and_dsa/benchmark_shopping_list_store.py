@@ -0,0 +1,60 @@
+"""
+Throughput benchmark for ShoppingListStore.
+
+Usage: python benchmark_shopping_list_store.py [ops_per_thread] [lists]
+Runs the same mixed add/remove/view workload at 1, 2, 4, 8 and 16 threads
+against a fresh store in a temporary directory and prints ops/sec.
+"""
+
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from shopping_list_store import ShoppingListStore
+
+THREAD_COUNTS = [1, 2, 4, 8, 16]
+ITEMS = [f"item-{i}" for i in range(1000)]
+
+
+def worker(store, ops, lists, seed):
+    rng = random.Random(seed)
+    for _ in range(ops):
+        list_id = f"list-{rng.randrange(lists)}"
+        roll = rng.random()
+        if roll < 0.5:
+            store.add(list_id, rng.choice(ITEMS))
+        elif roll < 0.8:
+            store.view(list_id)
+        else:
+            store.remove(list_id, rng.choice(ITEMS))
+
+
+def run(threads, ops_per_thread, lists):
+    """Run the workload with ``threads`` threads and return ops/sec."""
+    with tempfile.TemporaryDirectory() as directory:
+        with ShoppingListStore(directory, compact_every=50_000) as store:
+            workers = [
+                threading.Thread(target=worker, args=(store, ops_per_thread, lists, seed))
+                for seed in range(threads)
+            ]
+            start = time.perf_counter()
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
+            elapsed = time.perf_counter() - start
+    return threads * ops_per_thread / elapsed
+
+
+def main():
+    ops_per_thread = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lists = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    print(f"{ops_per_thread:,} ops per thread across {lists} lists")
+    for threads in THREAD_COUNTS:
+        print(f"{threads:>2} threads: {run(threads, ops_per_thread, lists):>12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
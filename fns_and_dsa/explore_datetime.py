@@ -1,4 +1,11 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the batch API falls back to datetime
+    np = None
+
 
 def display_current_datetime():
     current_date = datetime.now()
@@ -10,5 +17,60 @@ def calculate_future_date():
     future_date = current_date + timedelta(days=days)
     print(f"Future date: {future_date.strftime('%Y-%m-%d')}")
 
-display_current_datetime()
-calculate_future_date()
\ No newline at end of file
+
+def add_days(dates, days):
+    """
+    Add day offsets to many dates at once.
+
+    Args:
+        dates: A date or ISO date string, or a sequence of them
+        days: An int, or a sequence of ints the same length as ``dates``
+
+    Returns:
+        A ``datetime64[D]`` array when NumPy is installed, otherwise a list of
+        ``datetime.date`` objects
+    """
+    if np is not None:
+        # atleast_1d keeps scalar inputs an array, matching the list fallback
+        return np.atleast_1d(np.asarray(dates, dtype="datetime64[D]")
+                             + np.asarray(days, dtype="timedelta64[D]"))
+    if not isinstance(days, int):
+        days = list(days)
+    if isinstance(dates, (date, str)):
+        dates = [dates] * (1 if isinstance(days, int) else len(days))
+    dates = [date.fromisoformat(d) if isinstance(d, str) else d for d in dates]
+    if isinstance(days, int):
+        return [d + timedelta(days=days) for d in dates]
+    return [d + timedelta(days=n) for d, n in zip(dates, days, strict=True)]
+
+
+@lru_cache(maxsize=65536)
+def format_ordinal(ordinal):
+    """Return the ISO 'YYYY-MM-DD' string for a proleptic Gregorian ordinal."""
+    d = date.fromordinal(ordinal)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def format_dates(dates):
+    """
+    Format many dates as ISO 'YYYY-MM-DD' strings.
+
+    NumPy ``datetime64`` arrays are converted in one call; other dates go
+    through a cache keyed on the day, so repeated dates are formatted once.
+    """
+    if np is not None and isinstance(dates, (np.ndarray, np.datetime64)):
+        dates = np.atleast_1d(dates).astype("datetime64[D]")
+        return np.datetime_as_string(dates, unit="D").tolist()
+    return [format_ordinal(d.toordinal()) for d in dates]
+
+
+def future_dates(days, start=None):
+    """Return ISO date strings ``days`` after ``start`` (defaults to today)."""
+    if start is None:
+        start = date.today()
+    return format_dates(add_days(start, days))
+
+
+if __name__ == "__main__":
+    display_current_datetime()
+    calculate_future_date()
@@ -0,0 +1,192 @@
+"""
+Streaming sensor-feed converter.
+Converts a line-oriented temperature feed and keeps rolling min/max/mean
+over a sliding window of the most recent readings.
+"""
+
+import argparse
+import math
+import sys
+from collections import deque, namedtuple
+from itertools import islice
+
+from temp_conversion_tool import BATCH_CHUNK_SIZE, get_converter, parse_line
+
+Aggregate = namedtuple("Aggregate", ["count", "minimum", "maximum", "mean"])
+
+
+class RollingWindow:
+    """
+    Sliding window over the last ``size`` readings.
+
+    Minimum and maximum are tracked with monotonic deques and the mean with a
+    running sum, so each push is O(1) amortized and memory is O(size).
+    """
+
+    def __init__(self, size):
+        """
+        Initialize an empty window.
+
+        Args:
+            size (int): Number of most recent readings to aggregate over
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size <= 0:
+            raise ValueError("Window size must be positive.")
+        self.size = size
+        self._values = deque()
+        self._min = deque()  # (index, value), values increasing
+        self._max = deque()  # (index, value), values decreasing
+        self._sum = 0.0
+        self._count = 0
+        self._evictions = 0
+
+    def push(self, value):
+        """Add a reading, evicting the oldest one once the window is full."""
+        index = self._count
+        self._count += 1
+        self._values.append(value)
+        self._sum += value
+        if len(self._values) > self.size:
+            self._sum -= self._values.popleft()
+            self._evictions += 1
+            # Re-sum once per full turnover to stop floating point drift
+            if self._evictions == self.size:
+                self._sum = math.fsum(self._values)
+                self._evictions = 0
+
+        oldest = index - self.size
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        if self._min[0][0] <= oldest:
+            self._min.popleft()
+
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+        if self._max[0][0] <= oldest:
+            self._max.popleft()
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def count(self):
+        """Total number of readings pushed since creation."""
+        return self._count
+
+    @property
+    def minimum(self):
+        return self._min[0][1] if self._min else None
+
+    @property
+    def maximum(self):
+        return self._max[0][1] if self._max else None
+
+    @property
+    def mean(self):
+        return self._sum / len(self._values) if self._values else None
+
+    def snapshot(self):
+        """Return the current aggregates as an Aggregate tuple."""
+        return Aggregate(self._count, self.minimum, self.maximum, self.mean)
+
+
+class SensorFeed:
+    """Converts a temperature feed and emits windowed aggregates at an interval."""
+
+    def __init__(self, source="F", target="C", window=60, interval=60,
+                 chunk_size=BATCH_CHUNK_SIZE):
+        """
+        Args:
+            source (str): Unit of the incoming readings (C, F or K)
+            target (str): Unit to convert readings to (C, F or K)
+            window (int): Number of readings in the sliding window
+            interval (int): Emit an aggregate every ``interval`` readings
+            chunk_size (int): Number of lines converted together
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be positive.")
+        self.convert = get_converter(source, target)
+        self.window = RollingWindow(window)
+        self.interval = interval
+        self.chunk_size = chunk_size
+
+    def process(self, lines):
+        """
+        Consume a feed of text lines, one or more readings per line.
+
+        Yields:
+            Aggregate: Window aggregates after every ``interval`` readings
+
+        Raises:
+            ValueError: If a reading is not numeric; the message names the line.
+                Readings on the lines before it are still pushed first.
+        """
+        window = self.window
+        push = window.push
+        interval = self.interval
+        lines = iter(lines)
+        line_number = 0
+        while True:
+            chunk = list(islice(lines, self.chunk_size))
+            if not chunk:
+                return
+            readings = []
+            error = None
+            try:
+                for line in chunk:
+                    line_number += 1
+                    readings.extend(parse_line(line, line_number))
+            except ValueError as e:
+                error = e
+            converted = self.convert(readings)
+            if hasattr(converted, "tolist"):  # NumPy array
+                converted = converted.tolist()
+            for value in converted:
+                push(value)
+                if window.count % interval == 0:
+                    yield window.snapshot()
+            if error is not None:
+                raise error
+
+
+def synthetic_feed(count, seed=0):
+    """Yield ``count`` deterministic Fahrenheit readings as text lines."""
+    state = seed
+    for i in range(count):
+        # Cheap linear congruential jitter around a slow daily cycle
+        state = (state * 1103515245 + 12345) & 0x7FFFFFFF
+        yield f"{68 + 18 * math.sin(i / 3600) + (state % 100) / 50:.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a temperature feed with rolling aggregates")
+    parser.add_argument("file", nargs="?", help="Input file (defaults to stdin)")
+    parser.add_argument("--from", dest="source", default="F", type=str.upper,
+                        choices=["C", "F", "K"], help="Unit of the input readings (default: F)")
+    parser.add_argument("--to", dest="target", default="C", type=str.upper,
+                        choices=["C", "F", "K"], help="Unit to convert to (default: C)")
+    parser.add_argument("--window", type=int, default=60, help="Readings per window (default: 60)")
+    parser.add_argument("--interval", type=int, default=60,
+                        help="Emit aggregates every N readings (default: 60)")
+    args = parser.parse_args()
+
+    feed = SensorFeed(args.source, args.target, args.window, args.interval)
+    source = open(args.file, encoding="utf-8") if args.file else sys.stdin
+    try:
+        for agg in feed.process(source):
+            print(f"{agg.count} min={agg.minimum:.2f} max={agg.maximum:.2f} mean={agg.mean:.2f}")
+    except ValueError as e:
+        print(f"{e}. Please enter numeric values only.", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
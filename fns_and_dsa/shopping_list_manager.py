@@ -1,3 +1,168 @@
+import sys
+import time
+
+
+class ShoppingList:
+    """
+    Shopping list that keeps items in insertion order without duplicates.
+
+    Items are stored in a dict mapping each item to its quantity, which gives
+    O(1) add, remove and membership checks while preserving the order items
+    were first added.
+    """
+
+    def __init__(self, items=()):
+        """
+        Initialize a ShoppingList, optionally with initial items.
+
+        Args:
+            items (iterable): Items to add, repeats increase the quantity
+        """
+        self._items = {}
+        self.add_many(items)
+
+    def add(self, item, quantity=1):
+        """
+        Add an item, or increase its quantity if already listed.
+
+        Args:
+            item (str): The item to add
+            quantity (int): How many to add (defaults to 1)
+
+        Returns:
+            int: The item's new quantity
+        """
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        self._items[item] = self._items.get(item, 0) + quantity
+        return self._items[item]
+
+    def remove(self, item, quantity=None):
+        """
+        Remove an item, or reduce its quantity.
+
+        Args:
+            item (str): The item to remove
+            quantity (int): How many to remove; None removes the item entirely
+
+        Returns:
+            bool: True if the item was listed, False otherwise
+
+        Raises:
+            ValueError: If quantity is given and not positive
+        """
+        if quantity is not None and quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        current = self._items.get(item)
+        if current is None:
+            return False
+        if quantity is None or quantity >= current:
+            del self._items[item]
+        else:
+            self._items[item] = current - quantity
+        return True
+
+    def add_many(self, items):
+        """Add every item in an iterable. Returns the number of items processed."""
+        listed = self._items
+        count = 0
+        for item in items:
+            listed[item] = listed.get(item, 0) + 1
+            count += 1
+        return count
+
+    def remove_many(self, items):
+        """Remove one of each item in an iterable. Returns the number that were listed."""
+        listed = self._items
+        removed = 0
+        for item in items:
+            current = listed.get(item)
+            if current is None:
+                continue
+            if current > 1:
+                listed[item] = current - 1
+            else:
+                del listed[item]
+            removed += 1
+        return removed
+
+    def quantity(self, item):
+        """Return the quantity of an item, 0 if it is not listed."""
+        return self._items.get(item, 0)
+
+    def items(self):
+        """Return (item, quantity) pairs in insertion order."""
+        return list(self._items.items())
+
+    def clear(self):
+        self._items.clear()
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+
+def format_list(shopping_list):
+    """Return the numbered lines shown by View List."""
+    lines = []
+    for i, (item, quantity) in enumerate(shopping_list.items(), 1):
+        if quantity > 1:
+            lines.append(f"{i}. {item} (x{quantity})")
+        else:
+            lines.append(f"{i}. {item}")
+    return lines
+
+
+def run_script(commands, shopping_list=None):
+    """
+    Apply scripted commands without prompting.
+
+    Each command is ``add <item>``, ``remove <item>``, ``view`` or ``clear``.
+    Blank lines and lines starting with ``#`` are skipped.
+
+    Args:
+        commands (iterable): Command lines
+        shopping_list (ShoppingList): List to modify (a new one by default)
+
+    Returns:
+        ShoppingList: The resulting shopping list
+
+    Raises:
+        ValueError: If a command is not recognised or an item is missing
+    """
+    if shopping_list is None:
+        shopping_list = ShoppingList()
+    for line_number, line in enumerate(commands, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        command, _, item = line.partition(" ")
+        command = command.lower()
+        item = item.strip()
+        if command in ("add", "remove") and not item:
+            raise ValueError(f"Line {line_number}: '{command}' needs an item")
+        if command == "add":
+            shopping_list.add(item)
+        elif command == "remove":
+            shopping_list.remove(item, 1)
+        elif command == "view":
+            # Rendered but not printed so timings measure the list, not the terminal
+            format_list(shopping_list)
+        elif command == "clear":
+            shopping_list.clear()
+        else:
+            raise ValueError(f"Line {line_number}: unknown command '{command}'")
+    return shopping_list
+
+
 def display_menu():
     print("Shopping List Manager")
     print("1. Add Item")
@@ -6,27 +171,26 @@ def display_menu():
     print("4. Exit")
 
 def main():
-    shopping_list = []
+    shopping_list = ShoppingList()
     while True:
         display_menu()
         choice = input("Enter your choice: ")
 
         if choice == '1':
             item = input("Enter the item to add: ")
-            shopping_list.append(item)
+            shopping_list.add(item)
             print(f"'{item}' has been added to the shopping list.")
         elif choice == '2':
             item = input("Enter the item to remove: ")
-            if item in shopping_list:
-                shopping_list.remove(item)
+            if shopping_list.remove(item, 1):
                 print(f"'{item}' has been removed from the shopping list.")
             else:
                 print(f"'{item}' is not in the shopping list.")
         elif choice == '3':
             if shopping_list:
                 print("Current shopping list:")
-                for i, item in enumerate(shopping_list, 1):
-                    print(f"{i}. {item}")
+                for line in format_list(shopping_list):
+                    print(line)
             else:
                 print("The shopping list is empty.")
         elif choice == '4':
@@ -35,5 +199,21 @@ def main():
         else:
             print("Invalid choice. Please try again.")
 
+def run_script_file(path):
+    """Run a command script from a file (or stdin for '-') and report timing."""
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        start = time.perf_counter()
+        shopping_list = run_script(source)
+        elapsed = time.perf_counter() - start
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(f"Items in list: {len(shopping_list)}")
+    print(f"Elapsed: {elapsed:.4f} seconds")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        run_script_file(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,248 @@
+"""
+Persistent, thread-safe storage for many shopping lists.
+
+Every change is appended to an operation log before it is applied in memory.
+The log is periodically compacted into a snapshot file so start-up replays
+only the operations made since the last compaction.
+
+Files kept in the store directory:
+    snapshot.json   live lists at the last compaction, plus the log generation
+    oplog.<n>.jsonl operations made since that snapshot, one JSON array per line
+"""
+
+import json
+import os
+import threading
+
+from shopping_list_manager import ShoppingList
+
+SNAPSHOT_FILE = "snapshot.json"
+LOG_TEMPLATE = "oplog.{}.jsonl"
+
+# Number of logged operations between automatic compactions
+COMPACT_EVERY = 100_000
+
+
+class ShoppingListStore:
+    """
+    Append-only store of named shopping lists shared between threads.
+
+    Each list has its own lock so users editing different lists never wait on
+    each other. ``view`` returns a cached, immutable snapshot of a list that is
+    only rebuilt after the list changes.
+    """
+
+    def __init__(self, directory, compact_every=COMPACT_EVERY, sync=False):
+        """
+        Open (or create) a store and load its lists.
+
+        Args:
+            directory (str): Directory holding the snapshot and operation log
+            compact_every (int): Compact after this many logged operations;
+                0 disables automatic compaction
+            sync (bool): fsync the log after every operation
+        """
+        self.directory = directory
+        self.compact_every = compact_every
+        self.sync = sync
+        os.makedirs(directory, exist_ok=True)
+
+        self._lists = {}
+        self._locks = {}
+        self._views = {}
+        self._registry_lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._pending = 0
+
+        self._generation = self._load()
+        self._log = open(self._log_path(self._generation), "a", encoding="utf-8")
+
+    def _log_path(self, generation):
+        return os.path.join(self.directory, LOG_TEMPLATE.format(generation))
+
+    def _load(self):
+        """Load the snapshot, replay its log and return the log generation."""
+        generation = 0
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(snapshot_path):
+            with open(snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            generation = snapshot["generation"]
+            for list_id, items in snapshot["lists"].items():
+                shopping_list = self._get_list(list_id)
+                for item, quantity in items:
+                    shopping_list.add(item, quantity)
+
+        log_path = self._log_path(generation)
+        if os.path.exists(log_path):
+            with open(log_path, "r+b") as f:
+                good_end = 0
+                for line in f:
+                    # A crash can leave a partial last record; drop it and
+                    # anything after it so new records start on a clean line
+                    if not line.endswith(b"\n"):
+                        break
+                    if line.strip():
+                        try:
+                            op = json.loads(line)
+                        except ValueError:
+                            break
+                        self._apply(*op)
+                        self._pending += 1
+                    good_end += len(line)
+                f.truncate(good_end)
+
+        # Logs older than the snapshot are left over from an interrupted compaction
+        for name in os.listdir(self.directory):
+            if name.startswith("oplog.") and name != LOG_TEMPLATE.format(generation):
+                os.remove(os.path.join(self.directory, name))
+        return generation
+
+    def _get_list(self, list_id):
+        shopping_list = self._lists.get(list_id)
+        if shopping_list is None:
+            with self._registry_lock:
+                shopping_list = self._lists.get(list_id)
+                if shopping_list is None:
+                    self._locks[list_id] = threading.Lock()
+                    shopping_list = self._lists[list_id] = ShoppingList()
+        return shopping_list
+
+    def _apply(self, op, list_id, item=None, quantity=None):
+        shopping_list = self._get_list(list_id)
+        if op == "add":
+            shopping_list.add(item, quantity)
+        elif op == "remove":
+            shopping_list.remove(item, quantity)
+        elif op == "clear":
+            shopping_list.clear()
+        else:
+            raise ValueError(f"Unknown operation in log: {op}")
+        self._views[list_id] = None
+
+    def _write(self, op):
+        """Append one operation to the log. Returns True when compaction is due."""
+        line = json.dumps(op, separators=(",", ":")) + "\n"
+        with self._log_lock:
+            self._log.write(line)
+            self._log.flush()
+            if self.sync:
+                os.fsync(self._log.fileno())
+            self._pending += 1
+            return bool(self.compact_every) and self._pending >= self.compact_every
+
+    def _modify(self, op, list_id, item=None, quantity=None):
+        self._get_list(list_id)
+        with self._locks[list_id]:
+            if op == "remove" and item not in self._lists[list_id]:
+                return False
+            # Apply first so a change that fails validation is never logged
+            self._apply(op, list_id, item, quantity)
+            due = self._write([op, list_id, item, quantity])
+        if due:
+            self.compact(blocking=False)
+        return True
+
+    def add(self, list_id, item, quantity=1):
+        """Add an item to a list, creating the list if needed."""
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        self._modify("add", list_id, item, quantity)
+
+    def remove(self, list_id, item, quantity=1):
+        """
+        Remove an item from a list, or reduce its quantity.
+
+        Returns:
+            bool: True if the item was listed, False otherwise
+        """
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        return self._modify("remove", list_id, item, quantity)
+
+    def clear(self, list_id):
+        """Remove every item from a list."""
+        self._modify("clear", list_id)
+
+    def view(self, list_id):
+        """
+        Return the items of a list as a tuple of (item, quantity) pairs.
+
+        The tuple is cached until the list next changes, so repeated views are
+        a dict lookup and do not take the list lock.
+        """
+        snapshot = self._views.get(list_id)
+        if snapshot is not None:
+            return snapshot
+        if list_id not in self._lists:
+            return ()
+        with self._locks[list_id]:
+            snapshot = self._views.get(list_id)
+            if snapshot is None:
+                snapshot = self._views[list_id] = tuple(self._lists[list_id].items())
+        return snapshot
+
+    def lists(self):
+        """Return the ids of all known lists."""
+        return list(self._lists)
+
+    def compact(self, blocking=True):
+        """
+        Write all live lists to a new snapshot and start an empty log.
+
+        Every list lock is held while the snapshot is taken so it matches the
+        log exactly. Returns False if another thread is already compacting
+        and ``blocking`` is False.
+        """
+        if not self._compact_lock.acquire(blocking):
+            return False
+        try:
+            with self._registry_lock:
+                locks = [self._locks[list_id] for list_id in sorted(self._locks)]
+                for lock in locks:
+                    lock.acquire()
+                try:
+                    with self._log_lock:
+                        self._write_snapshot()
+                finally:
+                    for lock in locks:
+                        lock.release()
+        finally:
+            self._compact_lock.release()
+        return True
+
+    def _write_snapshot(self):
+        generation = self._generation + 1
+        snapshot = {
+            "generation": generation,
+            "lists": {list_id: items.items() for list_id, items in self._lists.items() if items},
+        }
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp_path = snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, snapshot_path)
+
+        old_log = self._log
+        self._log = open(self._log_path(generation), "a", encoding="utf-8")
+        old_log.close()
+        os.remove(self._log_path(self._generation))
+        self._generation = generation
+        self._pending = 0
+
+    def close(self):
+        """Flush and close the operation log."""
+        with self._log_lock:
+            if not self._log.closed:
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,24 +1,198 @@
+import argparse
+import numbers
+import sys
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; iterables fall back to lists
+    np = None
+
 FAHRENHEIT_TO_CELSIUS_FACTOR = 5/9
 CELSIUS_TO_FAHRENHEIT_FACTOR = 9/5
+KELVIN_OFFSET = 273.15
 
-def convert_to_celsius(fahrenheit):
+# Number of input lines converted together in batch mode
+BATCH_CHUNK_SIZE = 65536
+
+
+def _vectorize(values, formula):
+    """
+    Apply a scalar conversion formula to a number, NumPy array or iterable.
+
+    Numbers and NumPy arrays are passed straight through so the formula runs
+    once over the whole array. Other iterables become a float array when
+    NumPy is installed, or a list of floats otherwise.
+    """
+    if isinstance(values, numbers.Real):
+        return formula(values)
+    if np is not None:
+        if not isinstance(values, np.ndarray):
+            values = np.fromiter(values, dtype=float)
+        return formula(values)
+    return [formula(float(value)) for value in values]
+
+
+def _fahrenheit_to_celsius(fahrenheit):
     global FAHRENHEIT_TO_CELSIUS_FACTOR
     return (fahrenheit - 32) * FAHRENHEIT_TO_CELSIUS_FACTOR
 
-def convert_to_fahrenheit(celsius):
+
+def _celsius_to_fahrenheit(celsius):
     global CELSIUS_TO_FAHRENHEIT_FACTOR
     return (celsius * CELSIUS_TO_FAHRENHEIT_FACTOR) + 32
 
-try:
-    temp = float(input("Enter the temperature to convert: "))
-    unit = input("Is this temperature in Celsius or Fahrenheit? (C/F): ").upper()
-    if unit == 'F':
-        converted = convert_to_celsius(temp)
-        print(f"{temp}°F is {converted}°C")
-    elif unit == 'C':
-        converted = convert_to_fahrenheit(temp)
-        print(f"{temp}°C is {converted}°F")
-    else:
-        print("Invalid unit. Please enter C or F.")
-except ValueError:
-    print("Invalid temperature. Please enter a numeric value.")
\ No newline at end of file
+
+def convert_to_celsius(fahrenheit):
+    """Convert Fahrenheit to Celsius. Accepts a number, array or iterable."""
+    return _vectorize(fahrenheit, _fahrenheit_to_celsius)
+
+
+def convert_to_fahrenheit(celsius):
+    """Convert Celsius to Fahrenheit. Accepts a number, array or iterable."""
+    return _vectorize(celsius, _celsius_to_fahrenheit)
+
+
+def celsius_to_kelvin(celsius):
+    """Convert Celsius to Kelvin. Accepts a number, array or iterable."""
+    return _vectorize(celsius, lambda c: c + KELVIN_OFFSET)
+
+
+def kelvin_to_celsius(kelvin):
+    """Convert Kelvin to Celsius. Accepts a number, array or iterable."""
+    return _vectorize(kelvin, lambda k: k - KELVIN_OFFSET)
+
+
+def fahrenheit_to_kelvin(fahrenheit):
+    """Convert Fahrenheit to Kelvin. Accepts a number, array or iterable."""
+    return _vectorize(fahrenheit, lambda f: _fahrenheit_to_celsius(f) + KELVIN_OFFSET)
+
+
+def kelvin_to_fahrenheit(kelvin):
+    """Convert Kelvin to Fahrenheit. Accepts a number, array or iterable."""
+    return _vectorize(kelvin, lambda k: _celsius_to_fahrenheit(k - KELVIN_OFFSET))
+
+
+CONVERTERS = {
+    ('F', 'C'): convert_to_celsius,
+    ('C', 'F'): convert_to_fahrenheit,
+    ('C', 'K'): celsius_to_kelvin,
+    ('K', 'C'): kelvin_to_celsius,
+    ('F', 'K'): fahrenheit_to_kelvin,
+    ('K', 'F'): kelvin_to_fahrenheit,
+}
+
+
+def get_converter(source, target):
+    """
+    Return the conversion function between two units (C, F or K).
+
+    Raises:
+        ValueError: If the unit pair is not supported
+    """
+    key = (source.upper(), target.upper())
+    if key[0] == key[1]:
+        return lambda values: _vectorize(values, lambda v: v)
+    try:
+        return CONVERTERS[key]
+    except KeyError:
+        raise ValueError(f"Unsupported conversion: {source} to {target}") from None
+
+
+def parse_line(line, line_number):
+    """
+    Return the whitespace or comma separated readings on a line as floats.
+
+    Raises:
+        ValueError: If a reading is not numeric; the message names the line
+    """
+    row = line.replace(",", " ").split()
+    try:
+        return [float(value) for value in row]
+    except ValueError:
+        raise ValueError(f"Line {line_number}: invalid temperature in {' '.join(row)!r}") from None
+
+
+def convert_stream(lines, source, target, precision=2, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Convert a stream of text lines holding whitespace or comma separated readings.
+
+    Lines are read in chunks of ``chunk_size``; every column in a chunk is
+    converted with a single call so memory stays bounded by the chunk size.
+
+    Yields:
+        str: Each converted line, columns separated by a single space
+
+    Raises:
+        ValueError: If a reading is not numeric; the message names the line
+    """
+    convert = get_converter(source, target)
+    lines = iter(lines)
+    line_number = 0
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        rows = []
+        readings = []
+        for line in chunk:
+            line_number += 1
+            row = parse_line(line, line_number)
+            rows.append(row)
+            readings.extend(row)
+        converted = convert(readings)
+        if np is not None:
+            converted = converted.tolist()
+        position = 0
+        for row in rows:
+            end = position + len(row)
+            yield " ".join(f"{value:.{precision}f}" for value in converted[position:end])
+            position = end
+
+
+def run_batch(args):
+    """Convert readings from a file or stdin and write them to stdout."""
+    source = open(args.file, encoding="utf-8") if args.file else sys.stdin
+    try:
+        out = sys.stdout
+        for line in convert_stream(source, args.source, args.target, args.precision):
+            out.write(line)
+            out.write("\n")
+    except ValueError as e:
+        # Earlier chunks have already been written; say where conversion stopped
+        print(f"{e}. Please enter numeric values only.", file=sys.stderr)
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 0
+
+
+def main():
+    try:
+        temp = float(input("Enter the temperature to convert: "))
+        unit = input("Is this temperature in Celsius or Fahrenheit? (C/F): ").upper()
+        if unit == 'F':
+            converted = convert_to_celsius(temp)
+            print(f"{temp}°F is {converted}°C")
+        elif unit == 'C':
+            converted = convert_to_fahrenheit(temp)
+            print(f"{temp}°C is {converted}°F")
+        else:
+            print("Invalid unit. Please enter C or F.")
+    except ValueError:
+        print("Invalid temperature. Please enter a numeric value.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description="Batch temperature conversion")
+        parser.add_argument("file", nargs="?", help="Input file (defaults to stdin)")
+        parser.add_argument("--from", dest="source", required=True, choices=["C", "F", "K"],
+                            type=str.upper, help="Unit of the input readings")
+        parser.add_argument("--to", dest="target", required=True, choices=["C", "F", "K"],
+                            type=str.upper, help="Unit to convert to")
+        parser.add_argument("--precision", type=int, default=2,
+                            help="Decimal places in the output (default: 2)")
+        sys.exit(run_batch(parser.parse_args()))
+    main()
@@ -0,0 +1,34 @@
+import unittest
+from datetime import date, datetime
+from explore_datetime import add_days, format_dates, future_dates
+
+
+class TestBatchDates(unittest.TestCase):
+    """Test class for the batch date arithmetic API."""
+
+    def test_scalar_inputs_return_lists(self):
+        """A single date and offset still give a one-element result."""
+        self.assertEqual(format_dates(add_days(date(2024, 2, 28), 1)), ["2024-02-29"])
+        self.assertEqual(format_dates(add_days("2024-12-31", 1)), ["2025-01-01"])
+        self.assertEqual(future_dates(5, start=date(2025, 1, 1)), ["2025-01-06"])
+
+    def test_sequences(self):
+        """Dates and offsets combine element-wise, scalars broadcast."""
+        self.assertEqual(
+            format_dates(add_days([date(2025, 1, 1), "2025-03-01"], [31, -1])),
+            ["2025-02-01", "2025-02-28"],
+        )
+        self.assertEqual(
+            future_dates([0, 1, 365], start=date(2023, 6, 15)),
+            ["2023-06-15", "2023-06-16", "2024-06-14"],
+        )
+
+    def test_format_matches_strftime(self):
+        """Formatting matches strftime for dates and datetimes."""
+        moment = datetime(2031, 7, 4, 12, 30)
+        self.assertEqual(format_dates([moment, moment.date()]),
+                         [moment.strftime('%Y-%m-%d')] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
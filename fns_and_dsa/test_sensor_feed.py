@@ -0,0 +1,54 @@
+import unittest
+from sensor_feed import RollingWindow, SensorFeed
+
+
+class TestRollingWindow(unittest.TestCase):
+    """Test class for RollingWindow aggregates."""
+
+    def test_matches_naive_window(self):
+        """Min, max and mean match a recomputed window at every step."""
+        readings = [5, 3, 8, 1, 1, 9, 2, 7, 4, 6, 0, 10, -3, 3]
+        window = RollingWindow(4)
+        for i, value in enumerate(readings):
+            window.push(value)
+            recent = readings[max(0, i - 3):i + 1]
+            self.assertEqual(window.minimum, min(recent))
+            self.assertEqual(window.maximum, max(recent))
+            self.assertAlmostEqual(window.mean, sum(recent) / len(recent))
+            self.assertEqual(len(window), len(recent))
+
+    def test_empty_and_invalid(self):
+        """An empty window has no aggregates; size must be positive."""
+        window = RollingWindow(3)
+        self.assertIsNone(window.minimum)
+        self.assertIsNone(window.maximum)
+        self.assertIsNone(window.mean)
+        with self.assertRaises(ValueError):
+            RollingWindow(0)
+
+
+class TestSensorFeed(unittest.TestCase):
+    """Test class for SensorFeed conversion and emission interval."""
+
+    def test_converts_and_emits_at_interval(self):
+        """Readings are converted and aggregates emitted every interval."""
+        feed = SensorFeed("F", "C", window=2, interval=2)
+        aggregates = list(feed.process(["32", "212, 50", "50"]))
+        self.assertEqual([agg.count for agg in aggregates], [2, 4])
+        self.assertAlmostEqual(aggregates[0].minimum, 0.0)
+        self.assertAlmostEqual(aggregates[0].maximum, 100.0)
+        self.assertAlmostEqual(aggregates[1].mean, 10.0)
+
+    def test_bad_reading_names_line(self):
+        """A bad reading reports its line after the readings before it are used."""
+        feed = SensorFeed("C", "C", window=10, interval=1)
+        aggregates = []
+        with self.assertRaisesRegex(ValueError, "Line 3: invalid temperature in '4 x'"):
+            for agg in feed.process(["1", "2, 3", "4 x", "5"]):
+                aggregates.append(agg)
+        self.assertEqual([agg.count for agg in aggregates], [1, 2, 3])
+        self.assertAlmostEqual(aggregates[-1].mean, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
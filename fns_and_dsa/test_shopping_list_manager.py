@@ -0,0 +1,57 @@
+import unittest
+from shopping_list_manager import ShoppingList, format_list, run_script
+
+
+class TestShoppingList(unittest.TestCase):
+    """Test class for the indexed ShoppingList."""
+
+    def setUp(self):
+        """Set up a ShoppingList with a repeated item."""
+        self.shopping_list = ShoppingList(["milk", "eggs", "milk"])
+
+    def test_deduplicates_with_quantities(self):
+        """Repeated items are stored once with a quantity, in first-added order."""
+        self.assertEqual(self.shopping_list.items(), [("milk", 2), ("eggs", 1)])
+        self.assertEqual(len(self.shopping_list), 2)
+        self.assertIn("eggs", self.shopping_list)
+        self.assertNotIn("bread", self.shopping_list)
+
+    def test_remove(self):
+        """Removing decrements the quantity, None removes the item entirely."""
+        self.assertTrue(self.shopping_list.remove("milk", 1))
+        self.assertEqual(self.shopping_list.quantity("milk"), 1)
+        self.assertTrue(self.shopping_list.remove("eggs"))
+        self.assertNotIn("eggs", self.shopping_list)
+        self.assertFalse(self.shopping_list.remove("bread"))
+        with self.assertRaises(ValueError):
+            self.shopping_list.add("bread", 0)
+        with self.assertRaises(ValueError):
+            self.shopping_list.remove("milk", 0)
+        with self.assertRaises(ValueError):
+            self.shopping_list.remove("milk", -2)
+        self.assertEqual(self.shopping_list.quantity("milk"), 1)
+
+    def test_bulk_operations(self):
+        """Bulk add and remove report how many items they touched."""
+        self.assertEqual(self.shopping_list.add_many(["bread", "eggs"]), 2)
+        self.assertEqual(self.shopping_list.remove_many(["milk", "eggs", "jam"]), 2)
+        self.assertEqual(self.shopping_list.items(), [("milk", 1), ("eggs", 1), ("bread", 1)])
+
+    def test_format_and_script(self):
+        """Scripted commands produce the same list as interactive use."""
+        result = run_script(["add tea", "# comment", "", "add tea", "add jam", "remove jam", "view"])
+        self.assertEqual(format_list(result), ["1. tea (x2)"])
+        with self.assertRaises(ValueError):
+            run_script(["buy tea"])
+
+    def test_script_items_are_stripped(self):
+        """Extra spaces around items are ignored and empty items rejected."""
+        result = run_script(["add  milk ", "add milk"])
+        self.assertEqual(result.items(), [("milk", 2)])
+        for command in ["add", "remove   "]:
+            with self.assertRaises(ValueError):
+                run_script([command])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from shopping_list_store import ShoppingListStore
+
+
+class TestShoppingListStore(unittest.TestCase):
+    """Test class for ShoppingListStore persistence."""
+
+    def setUp(self):
+        """Set up a store in a fresh temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reopen_replays_log(self):
+        """Lists survive closing and reopening the store."""
+        with ShoppingListStore(self.directory) as store:
+            store.add("alice", "milk", 2)
+            store.add("bob", "eggs")
+            self.assertTrue(store.remove("alice", "milk"))
+            self.assertFalse(store.remove("bob", "bread"))
+        with ShoppingListStore(self.directory) as store:
+            self.assertEqual(store.view("alice"), (("milk", 1),))
+            self.assertEqual(store.view("bob"), (("eggs", 1),))
+            self.assertEqual(store.view("carol"), ())
+
+    def test_reopen_after_torn_write(self):
+        """A partial record from a crash is dropped and later writes survive."""
+        with ShoppingListStore(self.directory) as store:
+            store.add("list", "milk")
+        log_name = next(name for name in os.listdir(self.directory) if name.startswith("oplog."))
+        with open(os.path.join(self.directory, log_name), "a", encoding="utf-8") as f:
+            f.write('["add","list","eg')
+        with ShoppingListStore(self.directory) as store:
+            self.assertEqual(store.view("list"), (("milk", 1),))
+            store.add("list", "bread")
+            store.add("list", "jam")
+        for _ in range(2):
+            with ShoppingListStore(self.directory) as store:
+                self.assertEqual(store.view("list"), (("milk", 1), ("bread", 1), ("jam", 1)))
+
+    def test_reopen_after_rejected_change(self):
+        """Changes that fail validation are not logged, so the store still opens."""
+        with ShoppingListStore(self.directory) as store:
+            store.add("list", "milk", 2)
+            with self.assertRaises(ValueError):
+                store.remove("list", "milk", 0)
+            with self.assertRaises(ValueError):
+                store.add("list", "eggs", -1)
+            with self.assertRaises(TypeError):
+                store.add("list", ["unhashable"])
+            store.add("list", "bread")
+        with ShoppingListStore(self.directory) as store:
+            self.assertEqual(store.view("list"), (("milk", 2), ("bread", 1)))
+
+    def test_replayed_ops_count_towards_compaction(self):
+        """Operations replayed at start-up count towards compact_every."""
+        with ShoppingListStore(self.directory, compact_every=0) as store:
+            for item in ["a", "b", "c"]:
+                store.add("list", item)
+        with ShoppingListStore(self.directory, compact_every=4) as store:
+            store.add("list", "d")
+        self.assertIn("oplog.1.jsonl", os.listdir(self.directory))
+
+    def test_compaction(self):
+        """Compaction keeps the lists and leaves a single, short log."""
+        with ShoppingListStore(self.directory, compact_every=3) as store:
+            for item in ["a", "b", "c", "d", "e"]:
+                store.add("list", item)
+            store.clear("other")
+        logs = [name for name in os.listdir(self.directory) if name.startswith("oplog.")]
+        self.assertEqual(len(logs), 1)
+        with ShoppingListStore(self.directory) as store:
+            self.assertEqual([item for item, _ in store.view("list")], ["a", "b", "c", "d", "e"])
+
+    def test_view_is_cached_until_change(self):
+        """Repeated views return the same snapshot until the list changes."""
+        with ShoppingListStore(self.directory) as store:
+            store.add("list", "tea")
+            first = store.view("list")
+            self.assertIs(store.view("list"), first)
+            store.add("list", "tea")
+            self.assertEqual(store.view("list"), (("tea", 2),))
+
+
+if __name__ == '__main__':
+    unittest.main()
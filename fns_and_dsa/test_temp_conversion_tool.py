@@ -0,0 +1,64 @@
+import unittest
+import temp_conversion_tool as tct
+from temp_conversion_tool import (convert_stream, convert_to_celsius, convert_to_fahrenheit,
+                                  get_converter)
+
+
+def as_list(values):
+    """Return converted values as a list whichever backend produced them."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+class TestConversions(unittest.TestCase):
+    """Test class for the temperature conversion functions."""
+
+    def test_scalars(self):
+        """Numbers convert to numbers."""
+        self.assertAlmostEqual(convert_to_celsius(212), 100.0)
+        self.assertAlmostEqual(convert_to_fahrenheit(-40), -40.0)
+        self.assertAlmostEqual(tct.celsius_to_kelvin(0), 273.15)
+        self.assertAlmostEqual(tct.kelvin_to_fahrenheit(273.15), 32.0)
+
+    def test_iterables(self):
+        """Lists, tuples and generators convert element-wise."""
+        for values in ([32, 212], (32, 212), (v for v in [32, 212])):
+            result = as_list(convert_to_celsius(values))
+            self.assertEqual(len(result), 2)
+            self.assertAlmostEqual(result[0], 0.0)
+            self.assertAlmostEqual(result[1], 100.0)
+
+    def test_kelvin_round_trip(self):
+        """Every Kelvin pair inverts its counterpart."""
+        self.assertAlmostEqual(tct.kelvin_to_celsius(tct.celsius_to_kelvin(21.5)), 21.5)
+        self.assertAlmostEqual(tct.fahrenheit_to_kelvin(32), 273.15)
+        self.assertAlmostEqual(tct.kelvin_to_fahrenheit(tct.fahrenheit_to_kelvin(98.6)), 98.6)
+
+    def test_get_converter(self):
+        """Identity pairs return the input, unknown units raise ValueError."""
+        self.assertEqual(get_converter("c", "C")(25), 25)
+        self.assertAlmostEqual(as_list(get_converter("k", "k")([1.5]))[0], 1.5)
+        self.assertIs(get_converter("F", "C"), convert_to_celsius)
+        with self.assertRaises(ValueError):
+            get_converter("C", "X")
+
+
+class TestConvertStream(unittest.TestCase):
+    """Test class for the batch stream converter."""
+
+    def test_multi_column(self):
+        """Whitespace and comma separated columns keep their line layout."""
+        lines = ["32 212\n", "50,  -40\n", "\n", "98.6\n"]
+        self.assertEqual(
+            list(convert_stream(lines, "F", "C", chunk_size=2)),
+            ["0.00 100.00", "10.00 -40.00", "", "37.00"],
+        )
+
+    def test_bad_input_names_the_line(self):
+        """A non-numeric reading raises ValueError naming its line."""
+        lines = ["32\n", "40\n", "50 abc\n"]
+        with self.assertRaisesRegex(ValueError, "Line 3"):
+            list(convert_stream(lines, "F", "C", chunk_size=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
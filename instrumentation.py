@@ -0,0 +1,264 @@
+"""
+Lightweight, opt-in instrumentation.
+Provides counters, latency histograms, a timing decorator and a timing
+context manager, plus JSON and Prometheus text export.
+
+Instrumentation is off by default. Set PERF_INSTRUMENTATION=1 (or call
+enable()) before the instrumented modules are imported; functions decorated
+while it is off are returned unchanged, so they cost nothing. Set
+PERF_INSTRUMENTATION_OUTPUT to a file path to write a snapshot at exit
+(a .prom suffix selects Prometheus text, anything else JSON).
+
+The project's scripts run from their own directories, so this module is
+found by putting the repository root on PYTHONPATH, e.g.
+    PYTHONPATH=. PERF_INSTRUMENTATION=1 python programming_paradigm/main-0.py deposit:50
+Without it, the scripts' ImportError fallback makes ``timed`` a no-op.
+
+Metrics are safe to update from several threads.
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from time import perf_counter_ns
+
+ENABLE_VAR = "PERF_INSTRUMENTATION"
+OUTPUT_VAR = "PERF_INSTRUMENTATION_OUTPUT"
+
+# Histogram upper bounds in nanoseconds: 1us doubling up to about 8.4s
+BUCKET_BOUNDS_NS = tuple(1000 * 2 ** i for i in range(24))
+
+_enabled = os.environ.get(ENABLE_VAR, "") not in ("", "0")
+
+
+def enable():
+    """Turn instrumentation on for functions decorated from now on."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Turn instrumentation off for functions decorated from now on."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+class Counter:
+    """A monotonically increasing count."""
+
+    def __init__(self, name):
+        self.name = name
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def reset(self):
+        with self._lock:
+            self.value = 0
+
+
+class Histogram:
+    """Latency histogram with fixed exponential buckets, in nanoseconds."""
+
+    def __init__(self, name, bounds=BUCKET_BOUNDS_NS):
+        self.name = name
+        self.bounds = bounds
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self.buckets = [0] * (len(self.bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+
+    def observe(self, ns):
+        """Record one duration in nanoseconds."""
+        index = bisect_left(self.bounds, ns)
+        with self._lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.total_ns += ns
+            if self.min_ns is None or ns < self.min_ns:
+                self.min_ns = ns
+            if self.max_ns is None or ns > self.max_ns:
+                self.max_ns = ns
+
+    def reset(self):
+        with self._lock:
+            self._clear()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "count": self.count,
+                "sum_ns": self.total_ns,
+                "min_ns": self.min_ns,
+                "max_ns": self.max_ns,
+                "mean_ns": self.total_ns / self.count if self.count else None,
+                "buckets": dict(zip([*map(str, self.bounds), "+Inf"], self.buckets)),
+            }
+
+
+class Registry:
+    """Named counters and histograms, created on first use."""
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name):
+        metric = self.counters.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.counters.setdefault(name, Counter(name))
+        return metric
+
+    def histogram(self, name):
+        metric = self.histograms.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.histograms.setdefault(name, Histogram(name))
+        return metric
+
+    def _items(self):
+        """Return sorted (name, metric) lists, copied so other threads can keep registering."""
+        with self._lock:
+            return sorted(self.counters.items()), sorted(self.histograms.items())
+
+    def reset(self):
+        """Zero every metric, keeping the objects decorated functions hold."""
+        counters, histograms = self._items()
+        for _, counter in counters:
+            counter.reset()
+        for _, histogram in histograms:
+            histogram.reset()
+
+    def snapshot(self):
+        """Return all metrics as a JSON-serializable dict."""
+        counters, histograms = self._items()
+        return {
+            "counters": {name: c.value for name, c in counters},
+            "histograms": {name: h.snapshot() for name, h in histograms},
+        }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        counters, histograms = self._items()
+        lines = []
+        for name, counter in counters:
+            metric = _metric_name(name) + "_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {counter.value}")
+        for name, histogram in histograms:
+            metric = _metric_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            data = histogram.snapshot()  # One consistent view of the buckets
+            cumulative = 0
+            for bound, count in zip(histogram.bounds, data["buckets"].values()):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {data["count"]}')
+            lines.append(f"{metric}_sum {data['sum_ns'] / 1e9}")
+            lines.append(f"{metric}_count {data['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, format=None):
+        """
+        Write a snapshot to a local file, replacing it atomically.
+
+        Args:
+            path (str): Destination file
+            format (str): "json" or "prometheus"; inferred from a .prom suffix if None
+        """
+        if format is None:
+            format = "prometheus" if path.endswith(".prom") else "json"
+        if format == "json":
+            text = self.to_json()
+        elif format == "prometheus":
+            text = self.to_prometheus()
+        else:
+            raise ValueError(f"Unknown format: {format}. Use json or prometheus.")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+
+def _metric_name(name):
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+
+
+REGISTRY = Registry()
+
+
+def timed(name, registry=REGISTRY):
+    """
+    Decorator recording call count, errors and latency under ``name``.
+
+    When instrumentation is disabled at decoration time the function is
+    returned unchanged.
+    """
+    def decorator(func):
+        if not _enabled:
+            return func
+        calls = registry.counter(f"{name}_calls")
+        errors = registry.counter(f"{name}_errors")
+        latency = registry.histogram(name)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                errors.inc()
+                raise
+            finally:
+                latency.observe(perf_counter_ns() - start)
+                calls.inc()
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def _timing(histogram):
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        histogram.observe(perf_counter_ns() - start)
+
+
+def timer(name, registry=REGISTRY):
+    """Context manager recording the latency of a block; a no-op when disabled."""
+    if not _enabled:
+        return nullcontext()
+    return _timing(registry.histogram(name))
+
+
+def count(name, amount=1, registry=REGISTRY):
+    """Increment a counter; a no-op when disabled."""
+    if _enabled:
+        registry.counter(name).inc(amount)
+
+
+if os.environ.get(OUTPUT_VAR):
+    atexit.register(lambda: REGISTRY.write(os.environ[OUTPUT_VAR]))
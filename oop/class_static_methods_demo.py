@@ -1,3 +1,10 @@
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
+
 class Calculator:
     """
     Calculator class demonstrating static methods and class methods.
@@ -6,6 +13,7 @@ class Calculator:
     calculation_type = "Arithmetic Operations"
     
     @staticmethod
+    @timed("class_static_methods_demo.add")
     def add(a, b):
         """
         Static method that returns the sum of two numbers.
@@ -14,6 +22,7 @@ class Calculator:
         return a + b
     
     @classmethod
+    @timed("class_static_methods_demo.multiply")
     def multiply(cls, a, b):
         """
         Class method that returns the product of two numbers.
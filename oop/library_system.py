@@ -1,3 +1,10 @@
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
+
 class Book:
     """
     Base class representing a generic book.
@@ -50,12 +57,14 @@ class Library:
         """
         self.books = []
     
+    @timed("library_system.add_book")
     def add_book(self, book):
         """
         Add a Book, EBook, or PrintBook instance to the library.
         """
         self.books.append(book)
     
+    @timed("library_system.list_books")
     def list_books(self):
         """
         Print details of each book in the library.
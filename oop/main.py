@@ -2,6 +2,7 @@
 Comprehensive testing script for the library management system.
 Demonstrates advanced OOP concepts including inheritance, composition, polymorphism, 
 encapsulation, and abstraction.
+Performance is measured separately by benchmark_suite.py at the repository root.
 """
 
 from library_system import Book, EBook, PrintBook, Library
@@ -173,40 +174,6 @@ def test_composition():
     branch_library.list_books()
 
 
-def test_performance():
-    """Test performance with larger collections."""
-    print("\n=== Testing Performance ===")
-    
-    import time
-    
-    large_library = Library("Large Library")
-    
-    # Add many books to test performance
-    start_time = time.time()
-    
-    for i in range(100):
-        if i % 3 == 0:
-            book = Book(f"Book {i}", f"Author {i % 10}")
-        elif i % 3 == 1:
-            book = EBook(f"EBook {i}", f"Author {i % 10}", 100 + i, "PDF")
-        else:
-            book = PrintBook(f"PrintBook {i}", f"Author {i % 10}", 200 + i, f"978-{i:010d}")
-        
-        large_library.add_book(book)
-    
-    add_time = time.time() - start_time
-    print(f"Added 100 books in {add_time:.4f} seconds")
-    
-    # Test search performance
-    start_time = time.time()
-    results = large_library.search_books("Book 50")
-    search_time = time.time() - start_time
-    print(f"Search completed in {search_time:.6f} seconds")
-    print(f"Found {len(results)} results")
-    
-    print(f"Total books in library: {len(large_library)}")
-
-
 def main():
     """Run all test cases."""
     print("Library Management System - Comprehensive Test Suite")
@@ -219,7 +186,6 @@ def main():
         test_polymorphism()
         test_iteration()
         test_composition()
-        test_performance()
         
         print("\n" + "=" * 60)
         print("[SUCCESS] All tests completed successfully!")
@@ -1,3 +1,10 @@
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
+
 class BankAccount:
     """A class representing a bank account with basic banking operations."""
     
@@ -10,6 +17,7 @@ class BankAccount:
         """
         self.account_balance = initial_balance
     
+    @timed("bank_account.deposit")
     def deposit(self, amount):
         """
         Deposit a specified amount into the account.
@@ -25,6 +33,7 @@ class BankAccount:
         else:
             print("Deposit amount must be positive.")
     
+    @timed("bank_account.withdraw")
     def withdraw(self, amount):
         """
         Withdraw a specified amount from the account if sufficient funds exist.
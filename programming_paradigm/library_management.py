@@ -3,6 +3,12 @@ Library Management System
 Implements Book and Library classes to demonstrate OOP concepts in Python.
 """
 
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
 
 class Book:
     """A class representing a book in a library."""
@@ -43,6 +49,7 @@ class Library:
         """Initialize a Library instance with an empty book collection."""
         self._books = []  # Private list to store Book instances
     
+    @timed("library_management.add_book")
     def add_book(self, book):
         """
         Add a book to the library collection.
@@ -52,6 +59,7 @@ class Library:
         """
         self._books.append(book)
     
+    @timed("library_management.check_out_book")
     def check_out_book(self, title):
         """
         Check out a book by title if it's available.
@@ -68,6 +76,7 @@ class Library:
                 return True
         return False
     
+    @timed("library_management.return_book")
     def return_book(self, title):
         """
         Return a book by title (make it available again).
@@ -84,6 +93,7 @@ class Library:
                 return True
         return False
     
+    @timed("library_management.list_available_books")
     def list_available_books(self):
         """Print all books that are currently available for checkout."""
         available_books = [book for book in self._books if book.is_available()]
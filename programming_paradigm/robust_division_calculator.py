@@ -1,3 +1,11 @@
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
+
+@timed("robust_division_calculator.safe_divide")
 def safe_divide(numerator, denominator):
     """
     Performs division with robust error handling.
@@ -1,18 +1,29 @@
+try:
+    from instrumentation import timed
+except ImportError:
+    def timed(name):
+        return lambda func: func
+
+
 class SimpleCalculator:
     """A simple calculator class that supports basic arithmetic operations."""
 
+    @timed("simple_calculator.add")
     def add(self, a, b):
         """Return the addition of a and b."""
         return a + b
 
+    @timed("simple_calculator.subtract")
     def subtract(self, a, b):
         """Return the subtraction of b from a."""
         return a - b
 
+    @timed("simple_calculator.multiply")
     def multiply(self, a, b):
         """Return the multiplication of a and b."""
         return a * b
 
+    @timed("simple_calculator.divide")
     def divide(self, a, b):
         """Return the division of a by b. Returns None if b is zero."""
         if b == 0:
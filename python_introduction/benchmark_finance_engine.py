@@ -0,0 +1,70 @@
+"""
+Benchmark the finance projection engine against per-customer scalar code.
+
+Usage: python benchmark_finance_engine.py [customers] [months]
+"""
+
+import random
+import sys
+import time
+
+from finance_engine import np, projected_savings, savings_schedule, simple_interest
+
+
+def scalar_projection(incomes, expenses):
+    """The finance_calculator.py arithmetic, one customer at a time."""
+    results = []
+    for income, expense in zip(incomes, expenses):
+        annual_savings = (income - expense) * 12
+        results.append(annual_savings + annual_savings * 0.05)
+    return results
+
+
+def scalar_schedule(incomes, expenses, months):
+    """Simulate each month of each customer's savings in Python loops."""
+    schedules = []
+    for income, expense in zip(incomes, expenses):
+        balance = 0.0
+        balances = []
+        for _ in range(months):
+            balance = balance * (1 + 0.05 / 12) + (income - expense)
+            balances.append(balance)
+        schedules.append(balances)
+    return schedules
+
+
+def timed(label, func, *args, baseline=None):
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    speedup = f"  ({baseline / elapsed:.1f}x)" if baseline else ""
+    print(f"{label:<28} {elapsed:8.3f} s{speedup}")
+    return elapsed
+
+
+def main():
+    customers = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 120
+    rng = random.Random(0)
+    incomes = [rng.uniform(2000, 10000) for _ in range(customers)]
+    expenses = [income * rng.uniform(0.5, 0.95) for income in incomes]
+    principals = [rng.uniform(100, 100000) for _ in range(customers)]
+    if np is not None:
+        incomes, expenses, principals = np.array(incomes), np.array(expenses), np.array(principals)
+
+    print(f"Customers: {customers:,}, months: {months} "
+          f"(NumPy {'available' if np is not None else 'not installed'})")
+    baseline = timed("scalar projection", scalar_projection, incomes, expenses)
+    timed("projected_savings", projected_savings, incomes, expenses, baseline=baseline)
+    timed("simple_interest", simple_interest, principals, 0.05, 3)
+
+    schedule_customers = max(1, customers // 100)
+    print(f"Schedules for {schedule_customers:,} customers:")
+    baseline = timed("month-by-month loop", scalar_schedule,
+                     incomes[:schedule_customers], expenses[:schedule_customers], months)
+    timed("savings_schedule", savings_schedule, incomes[:schedule_customers],
+          expenses[:schedule_customers], 0.05, months, baseline=baseline)
+
+
+if __name__ == "__main__":
+    main()
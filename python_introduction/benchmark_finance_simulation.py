@@ -0,0 +1,45 @@
+"""
+Scaling benchmark for the Monte Carlo savings simulator.
+
+Usage: python benchmark_finance_simulation.py [trajectories] [months]
+Runs the same simulation with 1, 2, 4, ... workers up to the number of
+cores and reports trajectories/sec and speedup over a single worker.
+"""
+
+import os
+import sys
+import time
+
+from finance_simulation import SimulationParams, np, run_simulation
+
+
+def worker_counts():
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+def main():
+    trajectories = int(sys.argv[1]) if len(sys.argv) > 1 else (2_000_000 if np is not None else 50_000)
+    months = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    params = SimulationParams(5000, 3000, months)
+    chunk_size = max(1, trajectories // 64)
+
+    print(f"Trajectories: {trajectories:,}, months: {months}, chunk size: {chunk_size:,} "
+          f"(NumPy {'available' if np is not None else 'not installed'})")
+    baseline = None
+    for workers in worker_counts():
+        start = time.perf_counter()
+        summary = run_simulation(params, trajectories, chunk_size=chunk_size, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>3} workers: {elapsed:8.3f} s  {trajectories / elapsed:>12,.0f} traj/s  "
+              f"({baseline / elapsed:.2f}x)  median ${summary['percentiles'][50]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
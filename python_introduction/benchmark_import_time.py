@@ -0,0 +1,54 @@
+"""
+Import-time benchmark for the intro_utils package.
+
+Usage: python benchmark_import_time.py [runs]
+Each statement runs in a fresh interpreter. The baseline is an empty
+interpreter, so the reported cost is the import alone. Also checks which
+statements end up importing NumPy.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    ("interpreter only", "pass"),
+    ("one function", "from intro_utils import hours_to_seconds"),
+    ("package", "import intro_utils"),
+    ("every function", "from intro_utils import *"),
+    ("first array call", "from intro_utils import hours_to_seconds; hours_to_seconds([1, 2])"),
+]
+
+CHECK_NUMPY = "; import sys; print('numpy' in sys.modules)"
+
+
+def time_statement(statement, runs):
+    """Return the median wall time of running ``statement`` in a new interpreter."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def loads_numpy(statement):
+    result = subprocess.run([sys.executable, "-c", statement + CHECK_NUMPY],
+                            check=True, capture_output=True, text=True)
+    return result.stdout.strip() == "True"
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    baseline = None
+    print(f"Median of {runs} runs per statement")
+    for label, statement in STATEMENTS:
+        elapsed = time_statement(statement, runs)
+        baseline = elapsed if baseline is None else baseline
+        print(f"{label:<18} {elapsed * 1000:8.2f} ms  (+{(elapsed - baseline) * 1000:6.2f} ms)  "
+              f"numpy loaded: {loads_numpy(statement)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Personal-finance projection engine.
+Array versions of finance_calculator.py and simple_interest.py: every
+function accepts numbers or equal-length sequences (scalars broadcast) and
+uses NumPy when it is installed.
+"""
+
+from functools import partial
+from itertools import accumulate, repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; sequences fall back to lists
+    np = None
+
+from intro_utils._elementwise import common_length, elementwise
+
+# finance_calculator.py adds 5% interest to a year of savings
+DEFAULT_ANNUAL_RATE = 0.05
+
+# The formulas always run on floats, so integer inputs cannot overflow
+_elementwise = partial(elementwise, dtype=float)
+
+
+def _annuity_factor(rate, periods):
+    """Value after ``periods`` end-of-period deposits of 1 at ``rate`` per period (arrays)."""
+    safe_rate = np.where(rate == 0, 1.0, rate)
+    return np.where(rate == 0, periods, np.expm1(periods * np.log1p(rate)) / safe_rate)
+
+
+def monthly_savings(monthly_income, monthly_expenses):
+    """Return income minus expenses."""
+    return _elementwise(lambda income, expenses: income - expenses,
+                        monthly_income, monthly_expenses)
+
+
+def projected_savings(monthly_income, monthly_expenses, annual_rate=DEFAULT_ANNUAL_RATE):
+    """Return a year of savings plus one year of interest, as in finance_calculator.py."""
+    return _elementwise(lambda income, expenses, rate: (income - expenses) * 12 * (1 + rate),
+                        monthly_income, monthly_expenses, annual_rate)
+
+
+def simple_interest(principal, rate, time):
+    """Return principal * rate * time, as in simple_interest.py."""
+    return _elementwise(lambda p, r, t: p * r * t, principal, rate, time)
+
+
+def compound_amount(principal, rate, years, periods_per_year=1):
+    """Return the balance after compounding ``periods_per_year`` times a year."""
+    return _elementwise(lambda p, r, t, n: p * (1 + r / n) ** (n * t),
+                        principal, rate, years, periods_per_year)
+
+
+def compound_interest(principal, rate, years, periods_per_year=1):
+    """Return the interest earned by compounding (balance minus principal)."""
+    return _elementwise(lambda p, r, t, n: p * (1 + r / n) ** (n * t) - p,
+                        principal, rate, years, periods_per_year)
+
+
+def savings_schedule(monthly_income, monthly_expenses, annual_rate=DEFAULT_ANNUAL_RATE, months=12):
+    """
+    Return month-by-month balances from saving each month and compounding monthly.
+
+    Balances come from the closed-form annuity value, so no month is simulated
+    in a loop. Deposits are made at the end of each month.
+
+    Returns:
+        With NumPy, an array of shape (customers, months) (or (months,) for
+        scalar inputs). Without NumPy, a list of balances per customer.
+
+    Raises:
+        ValueError: If the sequences do not all have the same length
+    """
+    if np is not None:
+        common_length(monthly_income, monthly_expenses, annual_rate)
+        savings = np.asarray(monthly_income, dtype=float) - np.asarray(monthly_expenses, dtype=float)
+        rate = np.asarray(annual_rate, dtype=float) / 12
+        savings, rate = np.broadcast_arrays(savings, rate)
+        periods = np.arange(1, months + 1)
+        return savings[..., None] * _annuity_factor(rate[..., None], periods)
+
+    def schedule(savings, rate):
+        growth = 1 + rate / 12
+        return list(accumulate(repeat(savings, months), lambda balance, deposit: balance * growth + deposit))
+
+    return _elementwise(lambda income, expenses, rate: schedule(income - expenses, rate),
+                        monthly_income, monthly_expenses, annual_rate)
@@ -0,0 +1,246 @@
+"""
+Monte Carlo savings simulator.
+Replaces the fixed 5% rate of finance_calculator.py with sampled monthly
+rates and expenses, runs many trajectories in chunks across a process pool
+and reports percentiles of the final balance.
+
+Memory stays bounded: each chunk is reduced to a fixed-size histogram before
+it leaves the worker, and the parent only merges histograms.
+"""
+
+import argparse
+import math
+import multiprocessing
+import random
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; chunks fall back to the random module
+    np = None
+
+SimulationParams = namedtuple(
+    "SimulationParams",
+    ["monthly_income", "monthly_expenses", "months", "mean_rate", "rate_volatility",
+     "expense_volatility"],
+    defaults=[12, 0.05, 0.02, 0.1],
+)
+SimulationParams.__doc__ = """
+Inputs for one simulation.
+
+mean_rate and rate_volatility are annual; each month's rate is drawn from a
+normal distribution scaled to a month. Each month's expenses are
+monthly_expenses times a normal factor with standard deviation
+expense_volatility.
+"""
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def simulate_chunk(params, size, seed):
+    """
+    Simulate ``size`` trajectories and return their final balances.
+
+    The same (params, size, seed) always gives the same balances, whichever
+    process runs the chunk.
+    """
+    months = params.months
+    monthly_rate = params.mean_rate / 12
+    monthly_volatility = params.rate_volatility / math.sqrt(12)
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        balance = np.zeros(size)
+        for _ in range(months):
+            rate = rng.normal(monthly_rate, monthly_volatility, size)
+            expenses = params.monthly_expenses * rng.normal(1.0, params.expense_volatility, size)
+            balance = balance * (1 + rate) + (params.monthly_income - expenses)
+        return balance
+
+    rng = random.Random(seed)
+    gauss = rng.gauss
+    balances = []
+    for _ in range(size):
+        balance = 0.0
+        for _ in range(months):
+            expenses = params.monthly_expenses * gauss(1.0, params.expense_volatility)
+            balance = balance * (1 + gauss(monthly_rate, monthly_volatility)) + (params.monthly_income - expenses)
+        balances.append(balance)
+    return balances
+
+
+class Histogram:
+    """Fixed-range histogram with overflow tracking and running moments."""
+
+    def __init__(self, low, high, bins):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.width = (high - low) / bins
+        self.counts = [0] * bins
+        self.below = 0
+        self.above = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, values):
+        """Add an array or list of values."""
+        if np is not None and isinstance(values, np.ndarray):
+            counts, _ = np.histogram(values, bins=self.bins, range=(self.low, self.high))
+            self.counts = [a + b for a, b in zip(self.counts, counts.tolist())]
+            self.below += int((values < self.low).sum())
+            self.above += int((values > self.high).sum())
+            self.count += values.size
+            self.total += float(values.sum())
+            self.total_squares += float((values * values).sum())
+            if values.size:
+                self.minimum = min(self.minimum, float(values.min()))
+                self.maximum = max(self.maximum, float(values.max()))
+            return
+        for value in values:
+            if value < self.low:
+                self.below += 1
+            elif value > self.high:
+                self.above += 1
+            else:
+                self.counts[min(int((value - self.low) / self.width), self.bins - 1)] += 1
+            self.count += 1
+            self.total += value
+            self.total_squares += value * value
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+
+    def merge(self, other):
+        """Add another histogram with the same range and bins into this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.below += other.below
+        self.above += other.above
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def std(self):
+        if not self.count:
+            return None
+        return math.sqrt(max(self.total_squares / self.count - self.mean ** 2, 0.0))
+
+    def percentile(self, q):
+        """
+        Estimate the q-th percentile (0-100) by interpolating within a bin.
+
+        Percentiles that fall outside the histogram range are clamped to the
+        observed minimum or maximum.
+        """
+        if not self.count:
+            return None
+        target = q / 100 * self.count
+        if target <= self.below:
+            return self.minimum
+        seen = self.below
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                return self.low + (index + (target - seen) / count) * self.width
+            seen += count
+        return self.maximum
+
+
+def _run_chunk(args):
+    params, size, seed, low, high, bins = args
+    histogram = Histogram(low, high, bins)
+    histogram.add(simulate_chunk(params, size, seed))
+    return histogram
+
+
+def _chunk_seed(seed, index):
+    if np is not None:
+        return np.random.SeedSequence([seed, index])
+    return seed * 1_000_003 + index
+
+
+def run_simulation(params, trajectories, chunk_size=100_000, workers=None, seed=0,
+                   bins=10_000, percentiles=DEFAULT_PERCENTILES):
+    """
+    Run ``trajectories`` simulations and summarize the final balances.
+
+    A small pilot chunk (index 0) fixes the histogram range; the trajectories
+    are then split into chunks seeded from (seed, chunk index), so results do
+    not depend on the number of workers.
+
+    Args:
+        params (SimulationParams): Simulation inputs
+        trajectories (int): Number of trajectories to simulate
+        chunk_size (int): Trajectories per chunk, bounding per-worker memory
+        workers (int): Processes to use; 1 runs in-process, None uses every core
+        seed (int): Base seed
+        bins (int): Histogram resolution
+        percentiles (tuple): Percentiles to report
+
+    Returns:
+        dict: count, mean, std, min, max and a percentile -> value mapping
+
+    Raises:
+        ValueError: If trajectories is not positive
+    """
+    if trajectories <= 0:
+        raise ValueError("Number of trajectories must be positive.")
+    pilot = simulate_chunk(params, min(10_000, trajectories), _chunk_seed(seed, 0))
+    low, high = min(pilot), max(pilot)
+    margin = (high - low) * 0.5 or abs(high) or 1.0
+    low, high = low - margin, high + margin
+
+    chunks = [
+        (params, min(chunk_size, trajectories - start), _chunk_seed(seed, index), low, high, bins)
+        for index, start in enumerate(range(0, trajectories, chunk_size), 1)
+    ]
+    result = Histogram(low, high, bins)
+    if workers == 1:
+        for chunk in chunks:
+            result.merge(_run_chunk(chunk))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for histogram in pool.imap(_run_chunk, chunks):
+                result.merge(histogram)
+
+    return {
+        "count": result.count,
+        "mean": result.mean,
+        "std": result.std,
+        "min": result.minimum,
+        "max": result.maximum,
+        "percentiles": {q: result.percentile(q) for q in percentiles},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo savings projection")
+    parser.add_argument("monthly_income", type=float)
+    parser.add_argument("monthly_expenses", type=float)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--rate", type=float, default=0.05, help="Mean annual rate (default: 0.05)")
+    parser.add_argument("--rate-volatility", type=float, default=0.02)
+    parser.add_argument("--expense-volatility", type=float, default=0.1)
+    parser.add_argument("--trajectories", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    params = SimulationParams(args.monthly_income, args.monthly_expenses, args.months,
+                              args.rate, args.rate_volatility, args.expense_volatility)
+    summary = run_simulation(params, args.trajectories, workers=args.workers, seed=args.seed)
+    print(f"Simulated {summary['count']:,} trajectories over {args.months} months.")
+    print(f"Mean projected savings: ${summary['mean']:.2f} (std ${summary['std']:.2f})")
+    for q, value in summary["percentiles"].items():
+        print(f"  {q:>3}th percentile: ${value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
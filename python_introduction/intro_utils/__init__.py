@@ -0,0 +1,36 @@
+"""
+Importable, array-friendly versions of the python_introduction scripts.
+
+Submodules are loaded on first attribute access, so
+``from intro_utils import hours_to_seconds`` imports only the time-unit
+module and never NumPy. NumPy itself is imported the first time a function
+receives a sequence rather than a number.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "convert_time": "time_units",
+    "hours_to_seconds": "time_units",
+    "seconds_to_hours": "time_units",
+    "rectangle_area": "geometry",
+    "future_age": "age",
+    "add": "arithmetic",
+    "subtract": "arithmetic",
+    "multiply": "arithmetic",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,55 @@
+"""
+Shared element-wise helper with a lazy, optional NumPy import.
+Also used by finance_engine.py, so there is one broadcasting rule for both.
+"""
+
+import numbers
+from itertools import repeat
+
+_numpy = None
+
+
+def _load_numpy():
+    """Import NumPy on first use; returns None if it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def common_length(*args):
+    """
+    Return the length shared by the sequence arguments, or None if all are numbers.
+
+    Raises:
+        ValueError: If the sequences do not all have the same length
+    """
+    lengths = {len(arg) for arg in args if not isinstance(arg, numbers.Real)}
+    if len(lengths) > 1:
+        raise ValueError(f"Sequences must have the same length, got lengths {sorted(lengths)}.")
+    return lengths.pop() if lengths else None
+
+
+def elementwise(formula, *args, dtype=None):
+    """
+    Apply ``formula`` to numbers or sequences, broadcasting scalars.
+
+    All-number calls never touch NumPy. Otherwise the formula runs once on
+    arrays (of ``dtype``, if given) when NumPy is installed, or element by
+    element on lists.
+
+    Raises:
+        ValueError: If the sequences do not all have the same length
+    """
+    length = common_length(*args)
+    if length is None:
+        return formula(*args)
+    np = _load_numpy()
+    if np is not None:
+        return formula(*(np.asarray(arg, dtype=dtype) for arg in args))
+    columns = [repeat(arg, length) if isinstance(arg, numbers.Real) else arg for arg in args]
+    return [formula(*values) for values in zip(*columns, strict=True)]
@@ -0,0 +1,11 @@
+"""Age projection, generalising future_age_calculator.py."""
+
+from ._elementwise import elementwise
+
+# future_age_calculator.py projects ages 27 years ahead, to 2050
+DEFAULT_YEARS_AHEAD = 27
+
+
+def future_age(current_age, years_ahead=DEFAULT_YEARS_AHEAD):
+    """Return current_age + years_ahead for numbers or sequences."""
+    return elementwise(lambda age, years: age + years, current_age, years_ahead)
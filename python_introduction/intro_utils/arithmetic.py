@@ -0,0 +1,18 @@
+"""Element-wise arithmetic, generalising basic_operations.py."""
+
+from ._elementwise import elementwise
+
+
+def add(a, b):
+    """Return a + b element-wise."""
+    return elementwise(lambda x, y: x + y, a, b)
+
+
+def subtract(a, b):
+    """Return a - b element-wise."""
+    return elementwise(lambda x, y: x - y, a, b)
+
+
+def multiply(a, b):
+    """Return a * b element-wise."""
+    return elementwise(lambda x, y: x * y, a, b)
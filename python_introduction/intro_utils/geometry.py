@@ -0,0 +1,8 @@
+"""Area calculations, generalising rectangle_area.py."""
+
+from ._elementwise import elementwise
+
+
+def rectangle_area(length, width):
+    """Return length * width for numbers or sequences."""
+    return elementwise(lambda length, width: length * width, length, width)
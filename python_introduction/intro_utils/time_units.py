@@ -0,0 +1,37 @@
+"""Time-unit conversion, generalising hours_to_seconds.py."""
+
+from ._elementwise import elementwise
+
+UNIT_SECONDS = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 3600,
+    "days": 86400,
+    "weeks": 604800,
+}
+
+
+def convert_time(values, from_unit, to_unit):
+    """
+    Convert numbers or sequences between time units.
+
+    Raises:
+        ValueError: If either unit is not in UNIT_SECONDS
+    """
+    try:
+        source, target = UNIT_SECONDS[from_unit], UNIT_SECONDS[to_unit]
+    except KeyError as e:
+        raise ValueError(f"Unknown time unit: {e.args[0]}. Choose from {', '.join(UNIT_SECONDS)}.") from None
+    if target == 1:
+        return elementwise(lambda v: v * source, values)
+    return elementwise(lambda v: v * source / target, values)
+
+
+def hours_to_seconds(hours):
+    """Return hours * 3600, as in hours_to_seconds.py."""
+    return convert_time(hours, "hours", "seconds")
+
+
+def seconds_to_hours(seconds):
+    """Return seconds / 3600."""
+    return convert_time(seconds, "seconds", "hours")
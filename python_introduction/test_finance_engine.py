@@ -0,0 +1,53 @@
+import unittest
+from finance_engine import (compound_amount, compound_interest, monthly_savings, projected_savings,
+                            savings_schedule, simple_interest)
+
+
+def as_list(values):
+    """Return a plain list from either a NumPy array or a list."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+class TestFinanceEngine(unittest.TestCase):
+    """Test class for the array finance functions."""
+
+    def test_scalars(self):
+        """Numbers in give numbers out, matching the original scripts."""
+        self.assertEqual(monthly_savings(5000, 3000), 2000)
+        self.assertAlmostEqual(projected_savings(5000, 3000), 25200)
+        self.assertAlmostEqual(simple_interest(1000, 0.05, 3), 150)
+        self.assertAlmostEqual(compound_amount(1000, 0.1, 2), 1210)
+        self.assertAlmostEqual(compound_interest(1000, 0.1, 2), 210)
+
+    def test_sequences_broadcast_scalars(self):
+        """Scalars are repeated against sequences."""
+        self.assertEqual(as_list(monthly_savings([5000, 4000], 3000)), [2000, 1000])
+        for got, expected in zip(as_list(simple_interest([100, 200], 0.1, [1, 2])), [10, 40]):
+            self.assertAlmostEqual(got, expected)
+
+    def test_mismatched_lengths(self):
+        """Sequences of different lengths are rejected instead of truncated."""
+        with self.assertRaises(ValueError):
+            monthly_savings([5000, 4000], [3000])
+        with self.assertRaises(ValueError):
+            simple_interest([100, 200], 0.1, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            savings_schedule([1100, 1000], [1000])
+
+    def test_savings_schedule(self):
+        """Monthly balances match saving and compounding month by month."""
+        balance, expected = 0, []
+        for _ in range(12):
+            balance = balance * (1 + 0.06 / 12) + 100
+            expected.append(balance)
+        for got, want in zip(as_list(savings_schedule(1100, 1000, 0.06)), expected):
+            self.assertAlmostEqual(got, want)
+        rows = as_list(savings_schedule([1100, 1000], 1000, 0.06, months=3))
+        self.assertEqual(len(rows), 2)
+        for got, want in zip(rows[0], expected):
+            self.assertAlmostEqual(got, want)
+        self.assertEqual(rows[1], [0, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import math
+import random
+import unittest
+from finance_simulation import Histogram, SimulationParams, run_simulation
+
+
+def nearest_rank(values, q):
+    """Return the q-th percentile of values by the nearest-rank method."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)), 1) - 1]
+
+
+class TestHistogram(unittest.TestCase):
+    """Test class for the fixed-range histogram."""
+
+    def test_percentile_matches_sorted_list(self):
+        """Interpolated percentiles are within one bin of the exact value."""
+        rng = random.Random(1)
+        for size in [1, 2, 7, 50]:
+            values = [rng.uniform(0, 1) for _ in range(size)]
+            histogram = Histogram(0, 1, 1000)
+            histogram.add(values)
+            for q in [1, 5, 25, 50, 75, 95, 100]:
+                self.assertLessEqual(abs(histogram.percentile(q) - nearest_rank(values, q)),
+                                     histogram.width + 1e-12)
+
+    def test_moments(self):
+        """Count, mean, std, min and max are exact."""
+        histogram = Histogram(0, 10, 10)
+        histogram.add([2, 4, 4, 4, 5, 5, 7, 9])
+        self.assertEqual(histogram.count, 8)
+        self.assertAlmostEqual(histogram.mean, 5)
+        self.assertAlmostEqual(histogram.std, 2)
+        self.assertEqual((histogram.minimum, histogram.maximum), (2, 9))
+
+    def test_empty(self):
+        """An empty histogram has no mean, std or percentiles."""
+        histogram = Histogram(0, 1, 10)
+        self.assertIsNone(histogram.mean)
+        self.assertIsNone(histogram.std)
+        self.assertIsNone(histogram.percentile(50))
+
+    def test_out_of_range_values_clamp(self):
+        """Values outside the range are counted and clamp percentiles to min and max."""
+        histogram = Histogram(0, 10, 10)
+        histogram.add([-5, 1, 2, 20])
+        self.assertEqual((histogram.below, histogram.above), (1, 1))
+        self.assertEqual(sum(histogram.counts), 2)
+        self.assertEqual(histogram.percentile(25), -5)
+        self.assertEqual(histogram.percentile(100), 20)
+
+    def test_merge(self):
+        """Merging two histograms matches adding all values to one."""
+        values = [-1, 0.5, 3, 3.5, 9.9, 10, 12]
+        whole = Histogram(0, 10, 20)
+        whole.add(values)
+        first, second = Histogram(0, 10, 20), Histogram(0, 10, 20)
+        first.add(values[:3])
+        second.add(values[3:])
+        first.merge(second)
+        self.assertEqual(first.counts, whole.counts)
+        self.assertEqual((first.below, first.above, first.count), (whole.below, whole.above, whole.count))
+        self.assertEqual((first.minimum, first.maximum), (whole.minimum, whole.maximum))
+        self.assertAlmostEqual(first.mean, whole.mean)
+        self.assertAlmostEqual(first.std, whole.std)
+        for q in [10, 50, 90]:
+            self.assertAlmostEqual(first.percentile(q), whole.percentile(q))
+
+
+class TestRunSimulation(unittest.TestCase):
+    """Test class for the chunked simulation runner."""
+
+    params = SimulationParams(5000, 3000)
+
+    def test_summary(self):
+        """Every trajectory is counted and percentiles are ordered."""
+        summary = run_simulation(self.params, 250, chunk_size=100, workers=1, bins=100)
+        self.assertEqual(summary["count"], 250)
+        self.assertLessEqual(summary["min"], summary["percentiles"][5])
+        values = list(summary["percentiles"].values())
+        self.assertEqual(values, sorted(values))
+        self.assertLessEqual(values[-1], summary["max"])
+
+    def test_independent_of_workers(self):
+        """The same seed gives the same summary whatever the number of workers."""
+        single = run_simulation(self.params, 250, chunk_size=100, workers=1, bins=100)
+        pooled = run_simulation(self.params, 250, chunk_size=100, workers=2, bins=100)
+        self.assertEqual(single, pooled)
+
+    def test_rejects_no_trajectories(self):
+        """Zero trajectories is an error."""
+        with self.assertRaises(ValueError):
+            run_simulation(self.params, 0, workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
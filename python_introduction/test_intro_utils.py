@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+import unittest
+import intro_utils
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def as_list(values):
+    """Return a plain list from either a NumPy array or a list."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def fresh_modules(statement):
+    """Run ``statement`` in a new interpreter and return the modules it loaded."""
+    check = "; import sys; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", statement + check], cwd=HERE,
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestIntroUtils(unittest.TestCase):
+    """Test class for the lazily loaded intro_utils package."""
+
+    def test_import_loads_one_submodule(self):
+        """Importing one function loads only its submodule and never NumPy."""
+        modules = fresh_modules("from intro_utils import hours_to_seconds; hours_to_seconds(2)")
+        self.assertIn("intro_utils.time_units", modules)
+        self.assertNotIn("intro_utils.geometry", modules)
+        self.assertNotIn("intro_utils.arithmetic", modules)
+        self.assertNotIn("numpy", modules)
+
+    def test_package_import_loads_nothing(self):
+        """Importing the package alone loads no submodule."""
+        modules = fresh_modules("import intro_utils")
+        self.assertFalse({name for name in modules if name.startswith("intro_utils.")})
+
+    def test_unknown_attribute(self):
+        """Names that are not exported raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            intro_utils.no_such_function
+
+    def test_exports(self):
+        """Every exported name resolves and is listed by dir()."""
+        for name in intro_utils.__all__:
+            self.assertTrue(callable(getattr(intro_utils, name)))
+            self.assertIn(name, dir(intro_utils))
+
+    def test_scalars_and_sequences(self):
+        """Functions accept numbers or sequences, broadcasting scalars."""
+        self.assertEqual(intro_utils.add(2, 3), 5)
+        self.assertEqual(as_list(intro_utils.add([1, 2], 3)), [4, 5])
+        self.assertEqual(as_list(intro_utils.rectangle_area([2, 3], [4, 5])), [8, 15])
+        self.assertEqual(intro_utils.hours_to_seconds(2), 7200)
+
+    def test_mismatched_lengths(self):
+        """Sequences of different lengths are rejected instead of truncated."""
+        with self.assertRaises(ValueError):
+            intro_utils.add([1, 2], [3])
+        with self.assertRaises(ValueError):
+            intro_utils.multiply([1], [2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
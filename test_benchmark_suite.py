@@ -0,0 +1,32 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from benchmark_suite import compare, print_result, run_suite
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test class for the project benchmark suite."""
+
+    def test_zero_operation_size(self):
+        """A size too small to do any operations reports n/a instead of crashing."""
+        results = run_suite([1], repeat=1, warmup=0, name_filter="bank", memory=False)["results"]
+        self.assertEqual([result["ops"] for result in results], [0])
+        self.assertIsNone(results[0]["ns_per_op"])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_result(results[0])
+        self.assertIn("n/a ns/op", output.getvalue())
+
+    def test_run_and_compare(self):
+        """Every benchmark runs at a small size and compares against itself."""
+        document = run_suite([10], repeat=1, warmup=0, memory=False)
+        self.assertTrue(all(result["ops"] > 0 for result in document["results"]))
+        rows = compare(document, document)
+        self.assertEqual(len(rows), len(document["results"]))
+        with redirect_stdout(io.StringIO()):
+            for result in document["results"]:
+                print_result(result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import instrumentation
+from instrumentation import Registry, timed, timer
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test class for the opt-in instrumentation layer."""
+
+    def setUp(self):
+        """Set up a private registry and remember the enabled flag."""
+        self.registry = Registry()
+        self.was_enabled = instrumentation.is_enabled()
+
+    def tearDown(self):
+        if self.was_enabled:
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+
+    def test_disabled_returns_function_unchanged(self):
+        """Functions decorated while disabled are not wrapped."""
+        instrumentation.disable()
+
+        def add(a, b):
+            return a + b
+
+        self.assertIs(timed("add", self.registry)(add), add)
+        self.assertIsNone(timer("block", self.registry).__enter__())
+        self.assertEqual(self.registry.snapshot(), {"counters": {}, "histograms": {}})
+
+    def test_enabled_records_calls_errors_and_latency(self):
+        """Enabled decorators count calls and errors and time every call."""
+        instrumentation.enable()
+
+        @timed("divide", self.registry)
+        def divide(a, b):
+            return a / b
+
+        self.assertEqual(divide(6, 3), 2)
+        with self.assertRaises(ZeroDivisionError):
+            divide(1, 0)
+        with timer("block", self.registry):
+            pass
+
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["counters"], {"divide_calls": 2, "divide_errors": 1})
+        self.assertEqual(snapshot["histograms"]["divide"]["count"], 2)
+        self.assertEqual(snapshot["histograms"]["block"]["count"], 1)
+
+    def test_export(self):
+        """Snapshots export as JSON or Prometheus text files."""
+        self.registry.counter("lib.add_calls").inc(3)
+        self.registry.histogram("lib.add").observe(1500)
+        text = self.registry.to_prometheus()
+        self.assertIn("lib_add_calls_total 3", text)
+        self.assertIn('lib_add_seconds_bucket{le="2e-06"} 1', text)
+        self.assertIn("lib_add_seconds_count 1", text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.json")
+            self.registry.write(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["counters"]["lib.add_calls"], 3)
+            with self.assertRaises(ValueError):
+                self.registry.write(path, "xml")
+
+    def test_concurrent_updates(self):
+        """Updates from several threads are not lost."""
+        counter = self.registry.counter("hits")
+        histogram = self.registry.histogram("latency")
+
+        def work():
+            for _ in range(10_000):
+                counter.inc()
+                histogram.observe(1500)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.value, 80_000)
+        self.assertEqual(histogram.snapshot()["count"], 80_000)
+        self.assertEqual(sum(histogram.buckets), 80_000)
+        self.registry.reset()
+        self.assertEqual((counter.value, histogram.count), (0, 0))
+
+    def test_export_while_registering(self):
+        """Snapshots and resets can run while other threads register new metrics."""
+        done = threading.Event()
+
+        def register():
+            for i in range(20_000):
+                self.registry.counter(f"c{i}").inc()
+                self.registry.histogram(f"h{i}").observe(1)
+            done.set()
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads often to expose races
+        try:
+            thread = threading.Thread(target=register)
+            thread.start()
+            while not done.is_set():
+                self.registry.snapshot()
+                self.registry.to_prometheus()
+                self.registry.reset()
+            thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(len(self.registry.snapshot()["counters"]), 20_000)
+
+
+if __name__ == '__main__':
+    unittest.main()